@@ -4,16 +4,26 @@ GitHub Actions wrapper script for JSON generation
 This ensures the correct parameters are used in automated workflows
 """
 
+import io
 import sys
-import subprocess
+from contextlib import redirect_stdout
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+import process_csv
+
+def run_process_csv(csv_file, base_path):
+    """Run process_csv in --json-only mode for a single CSV file, capturing its output"""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        success = process_csv.process_csv_file(str(csv_file), base_path, json_only=True)
+    return success, output.getvalue()
+
 def main():
     """Generate JSON files for all CSV files in data directory"""
     
     # Find the script directory
     script_dir = Path(__file__).parent
-    process_script = script_dir / "process_csv.py"
     
     # Find CSV files in data directory
     data_dir = script_dir.parent / "data"
@@ -34,22 +44,15 @@ def main():
         print(f"\n🔄 Processing: {csv_file.name}")
         
         try:
-            # Run the process_csv.py script with --json-only flag
-            cmd = [
-                sys.executable,
-                str(process_script),
-                "--json-only",
-                str(csv_file)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=script_dir.parent)
+            # Process in-process with json_only=True (same as --json-only)
+            success, output = run_process_csv(csv_file, script_dir.parent)
             
-            if result.returncode == 0:
+            if success:
                 print(f"✅ Successfully processed {csv_file.name}")
                 success_count += 1
             else:
                 print(f"❌ Failed to process {csv_file.name}")
-                print(f"Error: {result.stderr}")
+                print(f"Error: {output}")
                 
         except Exception as e:
             print(f"❌ Exception processing {csv_file.name}: {str(e)}")
@@ -9,10 +9,74 @@ import csv
 import re
 import json
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import argparse
 
+# orjson is optional; fall back to the standard library encoder when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Thread count for per-student folder creation (the work is mostly filesystem calls)
+FOLDER_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Separator line under the CLI headers
+BANNER = "=" * 60
+
+# Common technology/methodology keywords used for project tags
+TAG_KEYWORDS = {
+    'machine learning': 'Machine Learning',
+    'deep learning': 'Deep Learning',
+    'neural network': 'Neural Networks',
+    'classification': 'Classification',
+    'regression': 'Regression',
+    'clustering': 'Clustering',
+    'nlp': 'Natural Language Processing',
+    'natural language': 'Natural Language Processing',
+    'computer vision': 'Computer Vision',
+    'image processing': 'Image Processing',
+    'data visualization': 'Data Visualization',
+    'predictive': 'Predictive Analytics',
+    'analysis': 'Data Analysis',
+    'python': 'Python',
+    'r programming': 'R',
+    'sql': 'SQL',
+    'web scraping': 'Web Scraping',
+    'api': 'API Integration',
+    'dashboard': 'Dashboard',
+    'time series': 'Time Series Analysis',
+    'forecasting': 'Forecasting',
+    'recommendation': 'Recommendation Systems',
+    'sentiment': 'Sentiment Analysis',
+    'text mining': 'Text Mining',
+    'big data': 'Big Data',
+    'spark': 'Apache Spark',
+    'hadoop': 'Hadoop',
+    'tensorflow': 'TensorFlow',
+    'pytorch': 'PyTorch',
+    'scikit': 'Scikit-learn',
+    'pandas': 'Pandas',
+    'numpy': 'NumPy',
+    'matplotlib': 'Matplotlib',
+    'seaborn': 'Seaborn',
+    'plotly': 'Plotly',
+    'tableau': 'Tableau',
+    'power bi': 'Power BI',
+    'excel': 'Excel',
+    'statistics': 'Statistics',
+    'statistical': 'Statistics'
+}
+
+# Single alternation over all keywords; the lookahead keeps matches zero-width so
+# overlapping keywords ("big data visualization") are all found in one pass
+_TAG_PATTERN = re.compile('(?=(' + '|'.join(re.escape(k) for k in TAG_KEYWORDS) + '))')
+_TAG_ORDER = {keyword: i for i, keyword in enumerate(TAG_KEYWORDS)}
+
 def clean_email(email):
     """
     Clean email address by removing worldclass subdomain
@@ -26,8 +90,8 @@ def clean_email(email):
     
     # Ensure it ends with @regis.edu if it doesn't already
     if '@regis.edu' not in email and '@' in email:
-        username = email.split('@')[0]
-        email = f"{username}@regis.edu"
+        # partition stops at the first '@' instead of splitting the whole address
+        email = email.partition('@')[0] + '@regis.edu'
     
     return email
 
@@ -36,6 +100,12 @@ def parse_course_code(csv_filename):
     Parse course information from CSV filename
     2025_Summer_MSDS692.csv -> {year: 2025, semester: summer, course: msds692}
     """
+    # Callers get their own copy so the cached dict is never modified
+    return dict(_parse_course_code(csv_filename))
+
+@lru_cache(maxsize=64)
+def _parse_course_code(csv_filename):
+    """Cached parse behind parse_course_code (filenames repeat across batch runs)"""
     # Remove .csv extension and split by underscore
     base_name = os.path.splitext(csv_filename)[0]
     parts = base_name.split('_')
@@ -48,7 +118,7 @@ def parse_course_code(csv_filename):
         # Create folder name: 2025_summer_msds692
         folder_name = f"{year}_{semester}_{course}"
         
-        return {
+        course_info = {
             'year': year,
             'semester': semester,
             'course': course,
@@ -57,13 +127,181 @@ def parse_course_code(csv_filename):
         }
     else:
         # Fallback for non-standard names
-        return {
+        course_info = {
             'year': '2025',
             'semester': 'spring',
             'course': 'msds692',
             'folder_name': base_name,
             'display_name': base_name
         }
+    
+    # Course type is the same for every row in the CSV, so decide it here once
+    is_msds692 = 'msds692' in course_info['course']
+    course_info['is_msds692'] = is_msds692
+    course_info['course_number'] = "MSDS 692" if is_msds692 else "MSDS 696"
+    course_info['practicum_number'] = "I" if is_msds692 else "II"
+    
+    return course_info
+
+# The "*Generated on ...*" line at the end of each README; a new stamp alone isn't a change
+_GENERATED_ON_RE = re.compile(r'^\*Generated on [^\n]*\*$', re.MULTILINE)
+
+def same_content(current, content):
+    """True when current (None for a missing file) matches content, ignoring the generated-on stamp"""
+    if current is None:
+        return False
+    return current == content or _GENERATED_ON_RE.sub('', current) == _GENERATED_ON_RE.sub('', content)
+
+def write_if_changed(path, content, current=None):
+    """
+    Write text to path unless the file already contains that text (see same_content)
+    Pass current when the caller has already read the file to skip reading it again
+    Returns True if the file was written
+    """
+    if current is None:
+        try:
+            current = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            pass
+    
+    if same_content(current, content):
+        return False
+    
+    path.write_text(content, encoding='utf-8')
+    return True
+
+def json_payload(data):
+    """
+    Encode data as 2-space indented UTF-8 JSON bytes
+    Uses orjson when installed, otherwise json.dumps with matching output
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def write_json(path, data):
+    """
+    Write data as 2-space indented UTF-8 JSON with a single write
+    The file is written beside path and renamed over it, so readers never see half a file
+    """
+    payload = json_payload(data)
+    
+    tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+def mkdir_fast(path):
+    """
+    Create a directory with a single mkdir in the common case (parent exists, path doesn't)
+    Missing parents are created on demand; an existing directory is left alone
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+# Bytes per copy_file_range/sendfile call, and per read in the userspace fallback
+KERNEL_COPY_CHUNK = 1 << 23
+COPY_BUFFER_SIZE = 1 << 20
+
+# Per-thread buffer reused by every userspace fallback copy (allocated on first use)
+_copy_buffers = threading.local()
+
+def _copy_buffer():
+    """Return this thread's reusable COPY_BUFFER_SIZE memoryview"""
+    view = getattr(_copy_buffers, 'view', None)
+    if view is None:
+        view = _copy_buffers.view = memoryview(bytearray(COPY_BUFFER_SIZE))
+    return view
+
+def _copy_fd(src_fd, dst_fd):
+    """
+    Copy everything from src_fd to dst_fd, letting the kernel move the bytes when it can:
+    os.copy_file_range, then os.sendfile, then a plain read/write loop
+    """
+    copied = 0
+    
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        try:
+            while True:
+                n = copy_file_range(src_fd, dst_fd, KERNEL_COPY_CHUNK, copied, copied)
+                if n == 0:
+                    return
+                copied += n
+        except OSError:
+            pass  # Unsupported here (EXDEV, ENOSYS, EINVAL...); try the next method
+    
+    # copy_file_range used explicit offsets, so move dst to where it stopped
+    os.lseek(dst_fd, copied, os.SEEK_SET)
+    
+    sendfile = getattr(os, 'sendfile', None)
+    if sendfile is not None:
+        try:
+            while True:
+                n = sendfile(dst_fd, src_fd, copied, KERNEL_COPY_CHUNK)
+                if n == 0:
+                    return
+                copied += n
+        except OSError:
+            pass
+    
+    os.lseek(src_fd, copied, os.SEEK_SET)
+    os.lseek(dst_fd, copied, os.SEEK_SET)
+    buffer = _copy_buffer()
+    with open(src_fd, 'rb', buffering=0, closefd=False) as src:
+        while True:
+            n = src.readinto(buffer)
+            if not n:
+                return
+            view = buffer[:n]
+            while view:
+                view = view[os.write(dst_fd, view):]
+
+def fast_copy(src, dst):
+    """
+    Copy a file like shutil.copy2 (data plus permissions and timestamps),
+    moving the data with in-kernel copies where the platform supports them
+    """
+    binary = getattr(os, 'O_BINARY', 0)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o666)
+        try:
+            _copy_fd(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    shutil.copystat(src, dst)
+
+def copy_tree(src, dst):
+    """
+    Recursively copy directory src to the new directory dst (like shutil.copytree)
+    Uses os.scandir's cached entry types and fast_copy for the files
+    """
+    os.mkdir(dst)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            # Symlinks are followed, as copytree does by default
+            if entry.is_dir():
+                copy_tree(entry.path, target)
+            else:
+                fast_copy(entry.path, target)
+    
+    shutil.copystat(src, dst)
 
 def validate_csv_row(row, required_fields):
     """Validate CSV row has all required fields"""
@@ -78,76 +316,79 @@ def generate_fallback_url(base_url, field_name):
     """Generate fallback URL that redirects to profile"""
     return f"{base_url}#"  # Will redirect to profile page
 
+# Profile patterns, compiled once instead of on every student
+_PRACTICUM_RE = re.compile(r'## (MSDS \d+) - Practicum ([IV]+)\n\n(.*?)(?=\n## |$)', re.DOTALL)
+
+def replace_quoted_value(content, key, value):
+    """
+    Replace every key: "..." in content with key: "value"
+    Matches what key: ".*?" does without re.DOTALL (closing quote on the same line)
+    """
+    prefix = f'{key}: "'
+    parts = []
+    pos = search = 0
+    while True:
+        start = content.find(prefix, search)
+        if start < 0:
+            break
+        
+        value_start = start + len(prefix)
+        end = content.find('"', value_start)
+        newline = content.find('\n', value_start)
+        if end < 0 or 0 <= newline < end:
+            # No closing quote on this line; keep looking after this occurrence
+            search = start + 1
+            continue
+        
+        parts.append(content[pos:start])
+        parts.append(f'{prefix}{value}"')
+        pos = search = end + 1
+    
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+def replace_sections(content, header, new_section):
+    """
+    Replace every section that starts with header with new_section
+    A section runs up to the next '\n## ' heading or the end of the content
+    (same bounds as (?=\n## |$) without re.MULTILINE), found with str.find
+    """
+    parts = []
+    pos = 0
+    while True:
+        start = content.find(header, pos)
+        if start < 0:
+            break
+        
+        body_start = start + len(header)
+        end = content.find('\n## ', body_start)
+        if end < 0:
+            # '$' also matches just before a final newline
+            end = len(content)
+            if content.endswith('\n') and end - 1 >= body_start:
+                end -= 1
+        
+        parts.append(content[pos:start])
+        parts.append(new_section)
+        pos = end
+    
+    parts.append(content[pos:])
+    return ''.join(parts)
+
 def load_existing_profile(profile_path):
     """Load existing profile and extract practicum data"""
     if not profile_path.exists():
         return None, []
     
-    with open(profile_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = profile_path.read_text(encoding='utf-8')
     
     # Extract existing practicum sections
-    import re
-    practicum_pattern = r'## (MSDS \d+) - Practicum ([IV]+)\n\n(.*?)(?=\n## |$)'
-    existing_practica = re.findall(practicum_pattern, content, re.DOTALL)
+    existing_practica = _PRACTICUM_RE.findall(content)
     
     return content, existing_practica
 
-def create_markdown_profile(student_data, course_info, existing_content=None, existing_practica=None):
-    """
-    Create or update markdown profile from CSV data
-    Handles multiple practicum experiences in one profile
-    """
-    name = student_data['Student Name']
-    email = clean_email(student_data['Email'])
-    username = student_data['Username']
-    project_title = student_data['Project Title']
-    github = student_data.get('GitHub', '')
-    
-    # Determine course type
-    is_msds692 = 'msds692' in course_info['course'].lower()
-    course_number = "MSDS 692" if is_msds692 else "MSDS 696"
-    practicum_number = "I" if is_msds692 else "II"
-    
-    # Split name into first and last
-    name_parts = name.split(' ')
-    first_name = name_parts[0] if name_parts else username
-    last_name = ' '.join(name_parts[1:]) if len(name_parts) > 1 else ''
-    
-    # Generate tags based on project title
-    tags = extract_project_tags(project_title)
-    
-    # If updating existing profile, parse and merge
-    if existing_content and existing_practica:
-        return update_existing_profile(existing_content, existing_practica, student_data, course_info, practicum_number, project_title, tags)
-    
-    # Create new profile with current practicum
-    current_practicum_section = f'''## {course_number} - Practicum {practicum_number}
-
-**Title:** {project_title}
-
-**Semester:** {course_info['semester'].title()} {course_info['year']}
-
-**Tags:** {', '.join(tags)}
-
-**Abstract:** This project focuses on {project_title.lower()}. Please update this section with a detailed description of your project, methodology, and key findings.
-
-**Key Achievements:**
-- Please add your key project achievements
-- Include quantifiable results where possible
-- Highlight technical innovations or challenges overcome
-
-**Technologies Used:** Please list the main technologies and tools used in your project
-
-**Links:**
-- GitHub Repository: [{github if github else 'Add your GitHub link'}]({github if github else '#'})
-- Project Report: [Download Report](reports/{username}_practicum{practicum_number.lower()}_report.pdf)
-- Presentation Slides: [View Slides](presentations/{username}_practicum{practicum_number.lower()}_slides.pdf)
-
-*Please update the links above with your actual project URLs and ensure your PDF files are uploaded to the correct folders.*
-'''
-
-    markdown_content = f'''---
+# Full profile.md template for students without an existing profile
+PROFILE_TEMPLATE = '''---
 name: "{name}"
 firstName: "{first_name}"
 lastName: "{last_name}"
@@ -155,12 +396,12 @@ email: "{email}"
 username: "{username}"
 github: "{username}"
 linkedin: "{username}"
-graduation: "May {int(course_info['year']) + 1}"
+graduation: "May {graduation_year}"
 major: "Data Science"
 degree: "Master of Science in Data Science"
 university: "Regis University"
 current_course: "{course_number}"
-current_semester: "{course_info['semester'].title()} {course_info['year']}"
+current_semester: "{current_semester}"
 ---
 
 ## About Me
@@ -206,33 +447,17 @@ I am a dedicated Data Science graduate student at Regis University. My focus is
 
 *This profile was auto-generated from CSV data. Please update all sections with your actual information, projects, and experiences.*
 '''
-    
-    return markdown_content
 
-def update_existing_profile(existing_content, existing_practica, student_data, course_info, practicum_number, project_title, tags):
-    """Update existing profile with new practicum information"""
-    import re
-    
-    username = student_data['Username']
-    github = student_data.get('GitHub', '')
-    course_number = "MSDS 692" if 'msds692' in course_info['course'].lower() else "MSDS 696"
-    
-    # Check if this practicum already exists
-    practicum_exists = any(p[0] == course_number for p in existing_practica)
-    
-    if practicum_exists:
-        # Update existing practicum section
-        pattern = rf'(## {course_number} - Practicum {practicum_number}\n\n)(.*?)(?=\n## |$)'
-        
-        new_section = f'''## {course_number} - Practicum {practicum_number}
+# Practicum section shared by new profiles and updates to existing ones
+PRACTICUM_TEMPLATE = '''## {course_number} - Practicum {practicum_number}
 
 **Title:** {project_title}
 
-**Semester:** {course_info['semester'].title()} {course_info['year']}
+**Semester:** {semester}
 
-**Tags:** {', '.join(tags)}
+**Tags:** {tags}
 
-**Abstract:** This project focuses on {project_title.lower()}. Please update this section with a detailed description of your project, methodology, and key findings.
+**Abstract:** This project focuses on {project_title_lower}. Please update this section with a detailed description of your project, methodology, and key findings.
 
 **Key Achievements:**
 - Please add your key project achievements
@@ -242,121 +467,158 @@ def update_existing_profile(existing_content, existing_practica, student_data, c
 **Technologies Used:** Please list the main technologies and tools used in your project
 
 **Links:**
-- GitHub Repository: [{github if github else 'Add your GitHub link'}]({github if github else '#'})
-- Project Report: [Download Report](reports/{username}_practicum{practicum_number.lower()}_report.pdf)
-- Presentation Slides: [View Slides](presentations/{username}_practicum{practicum_number.lower()}_slides.pdf)
+- GitHub Repository: [{github_label}]({github_url})
+- Project Report: [Download Report](reports/{username}_practicum{practicum_slug}_report.pdf)
+- Presentation Slides: [View Slides](presentations/{username}_practicum{practicum_slug}_slides.pdf)
 
 *Please update the links above with your actual project URLs and ensure your PDF files are uploaded to the correct folders.*
-
 '''
-        
-        updated_content = re.sub(pattern, new_section, existing_content, flags=re.DOTALL)
-    else:
-        # Add new practicum section before Contact section
-        new_section = f'''## {course_number} - Practicum {practicum_number}
-
-**Title:** {project_title}
-
-**Semester:** {course_info['semester'].title()} {course_info['year']}
-
-**Tags:** {', '.join(tags)}
-
-**Abstract:** This project focuses on {project_title.lower()}. Please update this section with a detailed description of your project, methodology, and key findings.
-
-**Key Achievements:**
-- Please add your key project achievements
-- Include quantifiable results where possible
-- Highlight technical innovations or challenges overcome
 
-**Technologies Used:** Please list the main technologies and tools used in your project
+def build_profile_context(student_data, course_info):
+    """
+    Collect the values the profile and practicum templates need for one student
+    Built once and shared by render_new_profile and splice_practicum
+    """
+    name = student_data['Student Name']
+    username = student_data['Username']
+    project_title = student_data['Project Title']
+    github = student_data.get('GitHub', '')
+    practicum_number = course_info['practicum_number']
+    semester = f"{course_info['semester'].title()} {course_info['year']}"
+    
+    # Split name into first and last
+    name_parts = name.split(' ')
+    
+    return {
+        'name': name,
+        'first_name': name_parts[0] if name_parts else username,
+        'last_name': ' '.join(name_parts[1:]) if len(name_parts) > 1 else '',
+        'email': student_data['Email'],
+        'username': username,
+        'course_number': course_info['course_number'],
+        'practicum_number': practicum_number,
+        'practicum_slug': practicum_number.lower(),
+        'project_title': project_title,
+        'project_title_lower': project_title.lower(),
+        'current_semester': semester,
+        'semester': semester,
+        # Generate tags based on project title
+        'tags': ', '.join(extract_project_tags(project_title)),
+        'github_label': github if github else 'Add your GitHub link',
+        'github_url': github if github else '#',
+        'year': course_info['year']
+    }
 
-**Links:**
-- GitHub Repository: [{github if github else 'Add your GitHub link'}]({github if github else '#'})
-- Project Report: [Download Report](reports/{username}_practicum{practicum_number.lower()}_report.pdf)
-- Presentation Slides: [View Slides](presentations/{username}_practicum{practicum_number.lower()}_slides.pdf)
+def render_practicum_section(ctx):
+    """Render the practicum section for this course from PRACTICUM_TEMPLATE"""
+    return PRACTICUM_TEMPLATE.format_map(ctx)
 
-*Please update the links above with your actual project URLs and ensure your PDF files are uploaded to the correct folders.*
+def render_new_profile(ctx):
+    """Render a complete profile.md for a student without one"""
+    return PROFILE_TEMPLATE.format_map({
+        **ctx,
+        'graduation_year': int(ctx['year']) + 1,
+        'current_practicum_section': render_practicum_section(ctx)
+    })
 
-'''
-        
+def splice_practicum(existing_content, existing_practica, ctx):
+    """Update existing profile with new practicum information"""
+    course_number = ctx['course_number']
+    
+    # Same section text is used whether it replaces or is added
+    new_section = render_practicum_section(ctx) + '\n'
+    
+    # Check if this practicum already exists
+    practicum_exists = any(p[0] == course_number for p in existing_practica)
+    
+    if practicum_exists:
+        # Update existing practicum section
+        header = f"## {course_number} - Practicum {ctx['practicum_number']}\n\n"
+        updated_content = replace_sections(existing_content, header, new_section)
+    else:
         # Insert before Contact section
-        contact_pattern = r'(\n## Contact\n)'
-        if re.search(contact_pattern, existing_content):
-            updated_content = re.sub(contact_pattern, f'\n{new_section}\n## Contact\n', existing_content)
+        if '\n## Contact\n' in existing_content:
+            updated_content = existing_content.replace('\n## Contact\n', f'\n{new_section}\n## Contact\n')
         else:
             # If no Contact section found, append at end
             updated_content = existing_content.rstrip() + '\n\n' + new_section
     
     # Update frontmatter with current course info
-    frontmatter_pattern = r'(current_course: ".*?")'
-    updated_content = re.sub(frontmatter_pattern, f'current_course: "{course_number}"', updated_content)
-    
-    frontmatter_pattern = r'(current_semester: ".*?")'
-    updated_content = re.sub(frontmatter_pattern, f'current_semester: "{course_info["semester"].title()} {course_info["year"]}"', updated_content)
+    updated_content = replace_quoted_value(updated_content, 'current_course', course_number)
+    updated_content = replace_quoted_value(updated_content, 'current_semester', ctx['current_semester'])
     
     return updated_content
 
+def create_markdown_profile(student_data, course_info, existing_content=None, existing_practica=None):
+    """
+    Create or update markdown profile from CSV data
+    Handles multiple practicum experiences in one profile
+    """
+    ctx = build_profile_context(student_data, course_info)
+    
+    # If updating existing profile, splice this practicum into it
+    if existing_content and existing_practica:
+        return splice_practicum(existing_content, existing_practica, ctx)
+    
+    return render_new_profile(ctx)
+
 def extract_project_tags(project_title):
     """
     Extract relevant tags from project title
     """
-    tags = []
-    title_lower = project_title.lower()
-    
-    # Common technology/methodology keywords
-    tag_keywords = {
-        'machine learning': 'Machine Learning',
-        'deep learning': 'Deep Learning',
-        'neural network': 'Neural Networks',
-        'classification': 'Classification',
-        'regression': 'Regression',
-        'clustering': 'Clustering',
-        'nlp': 'Natural Language Processing',
-        'natural language': 'Natural Language Processing',
-        'computer vision': 'Computer Vision',
-        'image processing': 'Image Processing',
-        'data visualization': 'Data Visualization',
-        'predictive': 'Predictive Analytics',
-        'analysis': 'Data Analysis',
-        'python': 'Python',
-        'r programming': 'R',
-        'sql': 'SQL',
-        'web scraping': 'Web Scraping',
-        'api': 'API Integration',
-        'dashboard': 'Dashboard',
-        'time series': 'Time Series Analysis',
-        'forecasting': 'Forecasting',
-        'recommendation': 'Recommendation Systems',
-        'sentiment': 'Sentiment Analysis',
-        'text mining': 'Text Mining',
-        'big data': 'Big Data',
-        'spark': 'Apache Spark',
-        'hadoop': 'Hadoop',
-        'tensorflow': 'TensorFlow',
-        'pytorch': 'PyTorch',
-        'scikit': 'Scikit-learn',
-        'pandas': 'Pandas',
-        'numpy': 'NumPy',
-        'matplotlib': 'Matplotlib',
-        'seaborn': 'Seaborn',
-        'plotly': 'Plotly',
-        'tableau': 'Tableau',
-        'power bi': 'Power BI',
-        'excel': 'Excel',
-        'statistics': 'Statistics',
-        'statistical': 'Statistics'
-    }
+    # Find every keyword in one scan, then add tags in TAG_KEYWORDS order
+    found = {match.group(1) for match in _TAG_PATTERN.finditer(project_title.lower())}
     
-    for keyword, tag in tag_keywords.items():
-        if keyword in title_lower:
-            if tag not in tags:
-                tags.append(tag)
+    tags = []
+    for keyword in sorted(found, key=_TAG_ORDER.__getitem__):
+        tag = TAG_KEYWORDS[keyword]
+        if tag not in tags:
+            tags.append(tag)
+            if len(tags) == 5:  # Limit to 5 tags
+                break
     
     # If no specific tags found, add generic ones
     if not tags:
         tags = ['Data Science', 'Python', 'Analytics']
     
-    return tags[:5]  # Limit to 5 tags
+    return tags
+
+# Optional CSV columns copied into the course JSON when they hold a real link
+JSON_OPTIONAL_FIELDS = ('Blog', 'Demo', 'Other')
+
+# Prefix of the fallback URLs generated for empty link columns
+PLACEHOLDER_URL_PREFIX = 'https://your-portfolio-site.com'
+
+def url_or_hash(value):
+    """Return a real link unchanged, or '#' for missing, blank and placeholder values"""
+    if value and value.strip() and not value.startswith(PLACEHOLDER_URL_PREFIX):
+        return value
+    return '#'
+
+def build_student_json(student_data):
+    """Build one student's entry for the course JSON"""
+    username = student_data['Username']
+    
+    # Build student JSON structure
+    student_json = {
+        "username": username,
+        "name": student_data['Student Name'],
+        "email": student_data['Email'],
+        "projectTitle": student_data['Project Title'],
+        "avatarPath": f"https://raw.githubusercontent.com/iamgmujtaba/regis_std/main/data/students/{username}/avatar.jpg",  # Use .jpg extension
+        "github": url_or_hash(student_data.get('GitHub')),
+        "slides": url_or_hash(student_data.get('Presentation')),
+        "report": url_or_hash(student_data.get('Report')),
+        "profilePage": f"profiles/{username}.html"
+    }
+    
+    # Add optional fields if they exist
+    for field in JSON_OPTIONAL_FIELDS:
+        url = url_or_hash(student_data.get(field))
+        if url != '#':
+            student_json[field.lower()] = url
+    
+    return student_json
 
 def generate_course_json(students_data, course_info, csv_file):
     """
@@ -364,11 +626,12 @@ def generate_course_json(students_data, course_info, csv_file):
     This JSON will be used to create the unified student profiles
     """
     # Map course code for JSON
-    course_code = "MSDS692" if 'msds692' in course_info['course'].lower() else "MSDS696"
-    practicum_name = "Data Science Practicum I" if 'msds692' in course_info['course'].lower() else "Data Science Practicum II"
+    is_msds692 = course_info['is_msds692']
+    course_code = "MSDS692" if is_msds692 else "MSDS696"
+    practicum_name = "Data Science Practicum I" if is_msds692 else "Data Science Practicum II"
     
     # Determine term code (this might need adjustment based on your term system)
-    term_suffix = "8W1" if 'msds692' in course_info['course'].lower() else "8W2"
+    term_suffix = "8W1" if is_msds692 else "8W2"
     term_code = f"{course_info['year'][2:]}SU{term_suffix}"  # e.g., "25SU8W1"
     
     course_json = {
@@ -378,43 +641,69 @@ def generate_course_json(students_data, course_info, csv_file):
             "semester": course_info['semester'].title(),
             "year": course_info['year'],
             "term": term_code,
-            "description": f"{'Foundational' if 'msds692' in course_info['course'].lower() else 'Advanced'} practicum experience focusing on real-world data science applications {'and methodology' if 'msds692' in course_info['course'].lower() else 'and industry partnerships'}."
+            "description": f"{'Foundational' if is_msds692 else 'Advanced'} practicum experience focusing on real-world data science applications {'and methodology' if is_msds692 else 'and industry partnerships'}."
         },
-        "students": []
+        # One entry per student, built in a single pass
+        "students": [build_student_json(student_data) for student_data in students_data]
     }
     
-    # Add students
-    for student_data in students_data:
-        username = student_data['Username']
-        
-        # Build student JSON structure
-        student_json = {
-            "username": username,
-            "name": student_data['Student Name'],
-            "email": clean_email(student_data['Email']),
-            "projectTitle": student_data['Project Title'],
-            "avatarPath": f"https://raw.githubusercontent.com/iamgmujtaba/regis_std/main/data/students/{username}/avatar.jpg",  # Use .jpg extension
-            "github": student_data.get('GitHub', '#') if (student_data.get('GitHub', '').strip() and not student_data.get('GitHub', '').startswith('https://your-portfolio-site.com')) else '#',
-            "slides": student_data.get('Presentation', '#') if (student_data.get('Presentation', '').strip() and not student_data.get('Presentation', '').startswith('https://your-portfolio-site.com')) else '#',
-            "report": student_data.get('Report', '#') if (student_data.get('Report', '').strip() and not student_data.get('Report', '').startswith('https://your-portfolio-site.com')) else '#',
-            "profilePage": f"profiles/{username}.html"
-        }
-        
-        # Add optional fields if they exist
-        optional_fields = ['Blog', 'Demo', 'Other']
-        for field in optional_fields:
-            if (field in student_data and 
-                student_data[field] and 
-                student_data[field].strip() and 
-                student_data[field] != '#' and 
-                not student_data[field].startswith('https://your-portfolio-site.com')):
-                student_json[field.lower()] = student_data[field]
-        
-        course_json["students"].append(student_json)
-    
     return course_json
 
-def create_student_folder_structure(base_path, student_data, course_info):
+def new_plan():
+    """
+    Empty record of what a dry run would do: {'dirs': set of folders to create,
+    'files': {path: ('create' or 'update', new text or None for copies)}}
+    """
+    return {'dirs': set(), 'files': {}}
+
+def list_planned(path, plan=None):
+    """Names in a directory (empty when it doesn't exist), plus anything a dry-run plan has put there"""
+    try:
+        names = set(os.listdir(path))
+    except OSError:
+        names = set()
+    
+    if plan is not None:
+        names.update(p.name for p in plan['dirs'] if p.parent == path)
+        names.update(p.name for p in plan['files'] if p.parent == path)
+    return names
+
+def plan_write(plan, path, content, current=None):
+    """
+    Dry-run counterpart of write_if_changed: record the write in plan instead of making it
+    Returns True if a real run would write the file
+    """
+    if path in plan['files']:
+        # Written earlier in this run (repeated username); compare against that text
+        action, current = plan['files'][path]
+    else:
+        if current is None:
+            try:
+                current = path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                pass
+        action = 'update' if path.exists() else 'create'
+    
+    if same_content(current, content):
+        return False
+    
+    plan['files'][path] = (action, content)
+    return True
+
+def locate_default_files(base_path):
+    """
+    Check once per run for the shared avatar and example PDF every student folder starts with
+    Returns {'avatar': (path, exists), 'example_pdf': (path, exists)}
+    """
+    avatar = base_path / 'data' / 'avatar.jpg'
+    example_pdf = base_path / 'data' / 'example_pdf.pdf'
+    
+    return {
+        'avatar': (avatar, avatar.exists()),
+        'example_pdf': (example_pdf, example_pdf.exists())
+    }
+
+def create_student_folder_structure(base_path, student_data, course_info, generated_at=None, log=print, defaults=None, plan=None):
     """
     Create unified folder structure for student (works across multiple courses):
     data/students/username/
@@ -428,36 +717,59 @@ def create_student_folder_structure(base_path, student_data, course_info):
     │   └── username_practicum2_slides.pdf
     ├── assets/
     └── README.md
+    
+    Progress lines go through log (print by default) so parallel callers can buffer them
+    defaults is the result of locate_default_files, looked up here when not given
+    With a plan (see new_plan) nothing is created or written; the folders and files a real
+    run would create or change are recorded in it instead
     """
     username = student_data['Username']
     
+    if defaults is None:
+        defaults = locate_default_files(base_path)
+    
     # Create unified student directory (not course-specific)
     student_dir = base_path / 'data' / 'students' / username
-    student_dir.mkdir(parents=True, exist_ok=True)
+    if plan is None:
+        student_dir.mkdir(parents=True, exist_ok=True)
+    elif not student_dir.is_dir() and student_dir not in plan['dirs']:
+        plan['dirs'].add(student_dir)
+        log(f"    🔍 Would create folder: students/{username}/")
+    
+    # List the student folder once so reruns skip mkdir for subdirectories already there
+    existing = list_planned(student_dir, plan)
     
     # Create subdirectories
     subdirs = ['reports', 'presentations', 'assets']
     for subdir in subdirs:
-        (student_dir / subdir).mkdir(exist_ok=True)
+        if subdir not in existing:
+            if plan is None:
+                (student_dir / subdir).mkdir(exist_ok=True)
+            else:
+                plan['dirs'].add(student_dir / subdir)
     
     # Copy default avatar image to student directory if it doesn't exist
-    avatar_source = base_path / 'data' / 'avatar.jpg'
+    avatar_source, avatar_source_exists = defaults['avatar']
     avatar_dest = student_dir / 'avatar.jpg'
     
-    if avatar_source.exists() and not avatar_dest.exists():
+    avatar_present = 'avatar.jpg' in existing
+    if avatar_source_exists and not avatar_present and plan is not None:
+        plan['files'][avatar_dest] = ('create', None)
+        log(f"    🔍 Would copy default avatar to {username}/")
+    elif avatar_source_exists and not avatar_present:
         try:
             shutil.copy2(avatar_source, avatar_dest)
-            print(f"    🖼️  Copied default avatar to {username}/")
+            log(f"    🖼️  Copied default avatar to {username}/")
         except Exception as e:
-            print(f"    ⚠️  Warning: Could not copy avatar for {username}: {e}")
-    elif avatar_dest.exists():
-        print(f"    ✅ Avatar already exists for {username}")
+            log(f"    ⚠️  Warning: Could not copy avatar for {username}: {e}")
+    elif avatar_present:
+        log(f"    ✅ Avatar already exists for {username}")
     else:
-        print(f"    ⚠️  Warning: Default avatar not found at {avatar_source}")
+        log(f"    ⚠️  Warning: Default avatar not found at {avatar_source}")
     
     # Copy example PDF files for students to replace
-    example_pdf_source = base_path / 'data' / 'example_pdf.pdf'
-    if example_pdf_source.exists():
+    example_pdf_source, example_pdf_exists = defaults['example_pdf']
+    if example_pdf_exists:
         # Create example files with proper naming for students to replace
         example_files = [
             # CV file
@@ -470,47 +782,72 @@ def create_student_folder_structure(base_path, student_data, course_info):
             (student_dir / 'presentations' / f'{username}_practicum2_slides.pdf', 'Practicum II Presentation')
         ]
         
+        # Listings of the subfolders the example PDFs go into (student_dir was listed above)
+        listings = {student_dir: existing}
+        for subdir in ('reports', 'presentations'):
+            listings[student_dir / subdir] = list_planned(student_dir / subdir, plan)
+        
         for dest_file, file_type in example_files:
-            if not dest_file.exists():
+            if dest_file.name in listings[dest_file.parent]:
+                continue
+            if plan is not None:
+                plan['files'][dest_file] = ('create', None)
+                log(f"    🔍 Would copy example PDF as {file_type}: {dest_file.name}")
+            else:
                 try:
-                    shutil.copy2(example_pdf_source, dest_file)
-                    print(f"    📄 Copied example PDF as {file_type}: {dest_file.name}")
+                    fast_copy(example_pdf_source, dest_file)
+                    log(f"    📄 Copied example PDF as {file_type}: {dest_file.name}")
                 except Exception as e:
-                    print(f"    ⚠️  Warning: Could not copy example PDF for {file_type}: {e}")
+                    log(f"    ⚠️  Warning: Could not copy example PDF for {file_type}: {e}")
     else:
-        print(f"    ⚠️  Warning: Example PDF not found at {example_pdf_source}")
+        log(f"    ⚠️  Warning: Example PDF not found at {example_pdf_source}")
     
     # Handle profile.md creation/update
     profile_path = student_dir / 'profile.md'
     
-    # Load existing profile if it exists
-    existing_content, existing_practica = load_existing_profile(profile_path)
+    # Load existing profile if it exists (in a dry run, the one an earlier row would have written)
+    if plan is not None and profile_path in plan['files']:
+        existing_content = plan['files'][profile_path][1]
+        existing_practica = _PRACTICUM_RE.findall(existing_content)
+    elif 'profile.md' in existing:
+        existing_content, existing_practica = load_existing_profile(profile_path)
+    else:
+        existing_content, existing_practica = None, []
     
     # Create or update profile content
     if existing_content:
         profile_content = create_markdown_profile(student_data, course_info, existing_content, existing_practica)
-        print(f"    📝 Updated profile.md for {username} with {course_info['course'].upper()}")
+        action = 'update'
     else:
         profile_content = create_markdown_profile(student_data, course_info)
-        print(f"    📝 Created profile.md for {username}")
-    
-    # Write profile content
-    with open(profile_path, 'w', encoding='utf-8') as f:
-        f.write(profile_content)
+        action = 'create'
     
     # Create/update README.md
-    readme_content = create_student_readme(student_data, course_info)
+    readme_content = create_student_readme(student_data, course_info, generated_at)
     readme_path = student_dir / 'README.md'
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
+    
+    if plan is not None:
+        if plan_write(plan, profile_path, profile_content, existing_content):
+            log(f"    🔍 Would {action} profile.md for {username}")
+        else:
+            log(f"    ✅ profile.md already up to date for {username}")
+        if plan_write(plan, readme_path, readme_content):
+            log(f"    🔍 Would write README.md for {username}")
+        return student_dir
+    
+    if action == 'update':
+        log(f"    📝 Updated profile.md for {username} with {course_info['course'].upper()}")
+    else:
+        log(f"    📝 Created profile.md for {username}")
+    
+    # Write profile content (skipped when nothing changed)
+    write_if_changed(profile_path, profile_content, existing_content)
+    write_if_changed(readme_path, readme_content)
     
     return student_dir
 
-def create_student_readme(student_data, course_info):
-    """Create README with instructions for students - updated for unified profile"""
-    username = student_data['Username']
-    
-    return f'''# {student_data['Student Name']} - Data Science Portfolio
+# README.md template with instructions for students
+STUDENT_README_TEMPLATE = '''# {student_name} - Data Science Portfolio
 
 ## 📁 Unified Portfolio Structure
 
@@ -618,15 +955,49 @@ Your profile will automatically sync to the main portfolio site when you:
 3. Push changes to the repository
 
 ---
-*Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
+*Generated on {generated_at}*
 '''
 
+def create_student_readme(student_data, course_info, generated_at=None):
+    """Create README with instructions for students - updated for unified profile"""
+    username = student_data['Username']
+    
+    if generated_at is None:
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    return STUDENT_README_TEMPLATE.format_map({
+        'student_name': student_data['Student Name'],
+        'username': username,
+        'generated_at': generated_at
+    })
+
+
+def create_student_group(base_path, rows, course_info, generated_at, defaults, plan=None):
+    """
+    Create folders for all rows of one username, in CSV order
+    Log lines are buffered so the caller can print them in CSV order afterwards
+    In a dry run the rows share plan, so a repeated username sees what the earlier rows would write
+    Returns {row_num: (lines, student_dir, error)}
+    """
+    results = {}
+    for row_num, row in rows:
+        lines = []
+        try:
+            student_dir = create_student_folder_structure(base_path, row, course_info, generated_at,
+                                                          log=lines.append, defaults=defaults, plan=plan)
+            results[row_num] = (lines, student_dir, None)
+        except Exception as e:
+            results[row_num] = (lines, None, e)
+    
+    return results
 
-def process_csv_file(csv_path, base_path, json_only=False):
+def process_csv_file(csv_path, base_path, json_only=False, dry_run=False):
     """
     Process CSV file and either:
     1. Generate JSON files for GitHub Actions (json_only=True)
     2. Create student folder structures (json_only=False, original behavior)
+    With dry_run=True the whole pipeline runs (folders, profiles, READMEs, JSON) but nothing
+    is written; the folders and files a real run would create or update are reported instead
     """
     csv_file = Path(csv_path)
     
@@ -645,39 +1016,59 @@ def process_csv_file(csv_path, base_path, json_only=False):
     
     students_processed = 0
     students_created = 0
+    plans = []  # One dry-run plan per username
     errors = []
     students_data = []
+    outcomes = []  # (kind, row_num, row or error message) per CSV row, in order
+    
+    # One timestamp for every README generated from this CSV and for the summary
+    now = datetime.now()
+    generated_at = now.strftime("%Y-%m-%d %H:%M:%S")
+    processed_at = now.isoformat()
     
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        # newline='' lets the csv module handle line endings itself, as its docs require
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            fieldnames = next(reader, [])
             
             # Validate CSV headers
-            if not all(field in reader.fieldnames for field in required_fields):
-                missing = [field for field in required_fields if field not in reader.fieldnames]
+            if not all(field in fieldnames for field in required_fields):
+                missing = [field for field in required_fields if field not in fieldnames]
                 print(f"❌ Missing required columns: {missing}")
                 return False
             
             print(f"✅ CSV validation passed")
             print(f"📋 Required fields: {required_fields}")
-            print(f"📋 Optional fields: {[f for f in optional_fields if f in reader.fieldnames]}")
+            print(f"📋 Optional fields: {[f for f in optional_fields if f in fieldnames]}")
             
-            for row_num, row in enumerate(reader, start=2):
+            # Positions of the columns we use; for a repeated header the last one wins, as with DictReader
+            wanted = set(required_fields + optional_fields)
+            columns = {name: i for i, name in enumerate(fieldnames) if name in wanted}
+            
+            row_num = 1
+            for values in reader:
+                # Skip blank lines without counting them (same as DictReader)
+                if not values:
+                    continue
+                row_num += 1
+                
+                # Short rows read as None for missing columns, as with DictReader
+                row = {name: values[i] if i < len(values) else None for name, i in columns.items()}
+                
                 try:
                     # Validate required fields
                     missing_fields = validate_csv_row(row, required_fields)
                     if missing_fields:
-                        error_msg = f"Row {row_num}: Missing required fields: {missing_fields}"
-                        print(f"⚠️  {error_msg}")
-                        errors.append(error_msg)
+                        outcomes.append(('invalid', row_num, f"Row {row_num}: Missing required fields: {missing_fields}"))
                         continue
                     
-                    # Clean email
+                    # Clean email once here; profile and JSON builders use the cleaned value
                     row['Email'] = clean_email(row['Email'])
                     
                     # Generate fallback URLs for missing optional fields
                     username = row['Username']
-                    profile_base = f"https://your-portfolio-site.com/profiles/{username}"
+                    profile_base = f"{PLACEHOLDER_URL_PREFIX}/profiles/{username}"
                     
                     for field in optional_fields:
                         if field not in row or not row[field].strip():
@@ -685,30 +1076,76 @@ def process_csv_file(csv_path, base_path, json_only=False):
                     
                     # Store student data for JSON generation
                     students_data.append(row)
-                    
-                    if not json_only:
-                        # Create student folder structure (original behavior)
-                        student_dir = create_student_folder_structure(base_path, row, course_info)
-                        
-                        if student_dir:
-                            students_created += 1
-                            print(f"✅ Created: {row['Student Name']} ({username})")
-                    else:
-                        students_created += 1
-                        print(f"✅ Processed: {row['Student Name']} ({username})")
-                    
-                    students_processed += 1
+                    outcomes.append(('ok', row_num, row))
                     
                 except Exception as e:
-                    error_msg = f"Row {row_num}: Error processing {row.get('Student Name', 'Unknown')}: {str(e)}"
-                    print(f"❌ {error_msg}")
-                    errors.append(error_msg)
+                    outcomes.append(('error', row_num, f"Row {row_num}: Error processing {row.get('Student Name', 'Unknown')}: {str(e)}"))
                     continue
     
     except Exception as e:
         print(f"❌ Error reading CSV file: {str(e)}")
         return False
     
+    folder_results = {}
+    if not json_only:
+        # Each student only touches data/students/<username>, so students run in parallel;
+        # repeated rows for the same username stay together and run in CSV order
+        groups = {}
+        for kind, row_num, row in outcomes:
+            if kind == 'ok':
+                groups.setdefault(row['Username'], []).append((row_num, row))
+        
+        if groups:
+            # The shared avatar/example PDF don't change during the run; check them once
+            defaults = locate_default_files(base_path)
+            
+            plans = [new_plan() if dry_run else None for _ in groups]
+            with ThreadPoolExecutor(max_workers=min(FOLDER_WORKERS, len(groups))) as executor:
+                futures = [executor.submit(create_student_group, base_path, rows, course_info, generated_at, defaults, plan)
+                           for rows, plan in zip(groups.values(), plans)]
+                for future in futures:
+                    folder_results.update(future.result())
+    
+    # Report rows in CSV order
+    for kind, row_num, payload in outcomes:
+        if kind == 'invalid':
+            print(f"⚠️  {payload}")
+            errors.append(payload)
+            continue
+        if kind == 'error':
+            print(f"❌ {payload}")
+            errors.append(payload)
+            continue
+        
+        row = payload
+        username = row['Username']
+        
+        if not json_only:
+            # Create student folder structure (original behavior)
+            lines, student_dir, error = folder_results[row_num]
+            
+            if error is not None:
+                error_msg = f"Row {row_num}: Error processing {row.get('Student Name', 'Unknown')}: {str(error)}"
+                lines.append(f"❌ {error_msg}")
+                errors.append(error_msg)
+            elif dry_run:
+                lines.append(f"🔍 Checked: {row['Student Name']} ({username})")
+            elif student_dir:
+                students_created += 1
+                lines.append(f"✅ Created: {row['Student Name']} ({username})")
+            
+            # One write per student instead of one per line
+            if lines:
+                print('\n'.join(lines))
+            
+            if error is not None:
+                continue
+        else:
+            students_created += 1
+            print(f"✅ Processed: {row['Student Name']} ({username})")
+        
+        students_processed += 1
+    
     # Generate JSON file (always generate unless explicitly disabled)
     json_filename = None
     should_generate_json = True  # Always generate JSON by default
@@ -722,13 +1159,25 @@ def process_csv_file(csv_path, base_path, json_only=False):
         json_filename = f"{course_info['year']}_{course_info['semester']}_{course_info['course']}.json"
         json_path = base_path / 'data' / json_filename
         
-        # Ensure data directory exists
-        json_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(course_json, f, indent=2, ensure_ascii=False)
-        
-        print(f"📄 Generated JSON: {json_path}")
+        if dry_run:
+            try:
+                json_changed = json_path.read_bytes() != json_payload(course_json)
+                json_action = 'update'
+            except OSError:
+                json_changed, json_action = True, 'create'
+            
+            if json_changed:
+                plans.append({'dirs': set(), 'files': {json_path: (json_action, None)}})
+                print(f"🔍 Would {json_action} JSON: {json_path}")
+            else:
+                print(f"✅ JSON already up to date: {json_path}")
+        else:
+            # Ensure data directory exists
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            write_json(json_path, course_json)
+            
+            print(f"📄 Generated JSON: {json_path}")
         print(f"📊 JSON contains {len(course_json['students'])} students")
     elif not students_data:
         print(f"⚠️  No students data found for JSON generation")
@@ -742,7 +1191,7 @@ def process_csv_file(csv_path, base_path, json_only=False):
     # Create summary
     summary = {
         'course_info': course_info,
-        'processed_at': datetime.now().isoformat(),
+        'processed_at': processed_at,
         'students_processed': students_processed,
         'students_created': students_created,
         'errors': errors,
@@ -762,7 +1211,7 @@ def process_csv_file(csv_path, base_path, json_only=False):
         # Also save a unified summary
         # unified_summary_path = base_path / 'data' / 'students' / '_processing_summary.json'
         # unified_summary = {
-        #     'last_processed': datetime.now().isoformat(),
+        #     'last_processed': processed_at,
         #     'note': 'Students are stored in unified folders under data/students/',
         #     'course_summaries': {
         #         course_info['folder_name']: summary
@@ -776,115 +1225,181 @@ def process_csv_file(csv_path, base_path, json_only=False):
         #         if 'course_summaries' not in existing_unified:
         #             existing_unified['course_summaries'] = {}
         #         existing_unified['course_summaries'][course_info['folder_name']] = summary
-        #         existing_unified['last_processed'] = datetime.now().isoformat()
+        #         existing_unified['last_processed'] = processed_at
         #         unified_summary = existing_unified
         
         # unified_summary_path.parent.mkdir(parents=True, exist_ok=True)
         # with open(unified_summary_path, 'w', encoding='utf-8') as f:
         #     json.dump(unified_summary, f, indent=2, ensure_ascii=False)
     
-    # Print summary
-    print(f"\n📊 Processing Summary:")
-    print(f"   📁 Course: {course_info['display_name']}")
-    print(f"   👥 Students processed: {students_processed}")
-    
-    if json_only:
+    # Print summary (collected first, then written in one go)
+    lines = [
+        f"\n📊 Processing Summary:",
+        f"   📁 Course: {course_info['display_name']}",
+        f"   👥 Students processed: {students_processed}"
+    ]
+    
+    if dry_run:
+        # Dry run - nothing written; report what a real run would change
+        student_dirs = {base_path / 'data' / 'students' / row['Username'] for row in students_data}
+        planned_dirs = set().union(*(plan['dirs'] for plan in plans))
+        actions = [action for plan in plans for action, _ in plan['files'].values()]
+        lines.append(f"   🔧 Mode: Dry run (no files written)")
+        if not json_only:
+            lines.append(f"   📂 Student folders to create: {len(student_dirs & planned_dirs)}")
+        lines.append(f"   📄 Files to create: {actions.count('create')}")
+        lines.append(f"   ✏️  Files to update: {actions.count('update')}")
+    elif json_only:
         # GitHub Actions mode - JSON only
-        print(f"   🔧 Mode: GitHub Actions (JSON only)")
+        lines.append(f"   🔧 Mode: GitHub Actions (JSON only)")
         if json_filename:
-            print(f"   📄 JSON generated: {json_filename}")
-            print(f"   ✅ Students in JSON: {students_created}")
+            lines.append(f"   📄 JSON generated: {json_filename}")
+            lines.append(f"   ✅ Students in JSON: {students_created}")
         else:
-            print(f"   ❌ JSON generation failed - no student data found")
+            lines.append(f"   ❌ JSON generation failed - no student data found")
     else:
         # Terminal mode - Both folders and JSON
-        print(f"   🔧 Mode: Terminal (Folders + JSON)")
-        print(f"   ✅ Student folders created: {students_created}")
-        print(f"   📂 Student profiles location: data/students/")
+        lines.append(f"   🔧 Mode: Terminal (Folders + JSON)")
+        lines.append(f"   ✅ Student folders created: {students_created}")
+        lines.append(f"   📂 Student profiles location: data/students/")
         if json_filename:
-            print(f"   📄 JSON generated: {json_filename}")
-            print(f"   🎯 Ready for HTML generation with sync script")
+            lines.append(f"   📄 JSON generated: {json_filename}")
+            lines.append(f"   🎯 Ready for HTML generation with sync script")
         else:
-            print(f"   ❌ JSON generation failed")
+            lines.append(f"   ❌ JSON generation failed")
     
-    print(f"   ❌ Errors: {len(errors)}")
+    lines.append(f"   ❌ Errors: {len(errors)}")
     
     if errors:
-        print(f"\n⚠️  Errors encountered:")
-        for error in errors:
-            print(f"   • {error}")
+        lines.append(f"\n⚠️  Errors encountered:")
+        lines.extend(f"   • {error}" for error in errors)
+    
+    print('\n'.join(lines))
     
     return True
 
-def migrate_existing_folders(base_path):
+# Folders under data/ that are never old course folders (besides _-prefixed ones)
+RESERVED_DATA_DIRS = frozenset({'students'})
+
+def iter_course_dirs(data_path):
+    """Yield the scandir entries of the old course-specific folders under data/"""
+    with os.scandir(data_path) as entries:
+        for entry in entries:
+            if entry.name[0] != '_' and entry.name not in RESERVED_DATA_DIRS and entry.is_dir():
+                yield entry
+
+def enumerate_migration(data_path):
+    """
+    Inventory the old course-specific folders with one os.scandir per directory
+    Returns [(course_name, [(username, student_path), ...]), ...]
+    """
+    inventory = []
+    for course in iter_course_dirs(data_path):
+        with os.scandir(course.path) as entries:
+            students = [(entry.name, entry.path) for entry in entries
+                        if entry.name[0] != '_' and entry.is_dir()]
+        inventory.append((course.name, students))
+    
+    return inventory
+
+def migrate_student_folder(student_folder, unified_student_path, log=print):
+    """
+    Copy one course-specific student folder into its unified folder
+    Progress lines go through log (print by default) so parallel callers can buffer them
+    """
+    # Create unified student folder
+    mkdir_fast(unified_student_path)
+    
+    # Copy all files and subdirectories (scandir entries carry their type, no extra stat)
+    with os.scandir(student_folder) as items:
+        for item in items:
+            dest = os.path.join(unified_student_path, item.name)
+            
+            if item.is_file():
+                if not os.path.lexists(dest):
+                    fast_copy(item.path, dest)
+                    log(f"    📄 Copied {item.name}")
+                else:
+                    log(f"    ⚠️  File {item.name} already exists in unified folder")
+            elif item.is_dir():
+                if not os.path.lexists(dest):
+                    copy_tree(item.path, dest)
+                    log(f"    📁 Copied directory {item.name}")
+                else:
+                    # Merge directory contents
+                    with os.scandir(item.path) as subitems:
+                        for subitem in subitems:
+                            subdest = os.path.join(dest, subitem.name)
+                            if not os.path.lexists(subdest):
+                                if subitem.is_file():
+                                    fast_copy(subitem.path, subdest)
+                                else:
+                                    copy_tree(subitem.path, subdest)
+
+def migrate_student_buffered(student_folder, unified_student_path):
+    """Run migrate_student_folder with its log lines collected; returns (lines, error)"""
+    lines = []
+    try:
+        migrate_student_folder(student_folder, unified_student_path, log=lines.append)
+    except Exception as e:
+        return lines, e
+    return lines, None
+
+def migrate_existing_folders(base_path, serial=False):
     """
     Migrate existing course-specific folders to unified student structure
     Call this function to migrate from old structure to new unified structure
+    Pass serial=True to copy one student at a time (useful when debugging)
     """
     data_path = base_path / 'data'
     students_path = data_path / 'students'
     
-    # Find existing course folders
-    course_folders = []
-    for item in data_path.iterdir():
-        if item.is_dir() and item.name != 'students' and not item.name.startswith('_'):
-            course_folders.append(item)
+    # Plain strings for the per-file path work below (no Path object per join)
+    students_dir = os.fspath(students_path)
+    
+    # Find existing course folders and their students up front
+    inventory = enumerate_migration(data_path)
     
-    if not course_folders:
+    if not inventory:
         print("No existing course folders found to migrate.")
         return
     
-    print(f"🔄 Found {len(course_folders)} course folders to migrate:")
-    for folder in course_folders:
-        print(f"   📁 {folder.name}")
+    print(f"🔄 Found {len(inventory)} course folders to migrate:")
+    for course_name, _ in inventory:
+        print(f"   📁 {course_name}")
     
     students_migrated = 0
     
-    for course_folder in course_folders:
-        print(f"\n📂 Processing {course_folder.name}...")
+    for course_name, students in inventory:
+        print(f"\n📂 Processing {course_name}...")
         
-        for student_folder in course_folder.iterdir():
-            if student_folder.is_dir() and not student_folder.name.startswith('_'):
-                username = student_folder.name
-                
-                # Create unified student folder
-                unified_student_path = students_path / username
-                unified_student_path.mkdir(parents=True, exist_ok=True)
-                
-                # Copy files from old structure to new
-                import shutil
-                
-                # Copy all files and subdirectories
-                for item in student_folder.iterdir():
-                    dest = unified_student_path / item.name
-                    
-                    if item.is_file():
-                        if not dest.exists():
-                            shutil.copy2(item, dest)
-                            print(f"    📄 Copied {item.name}")
-                        else:
-                            print(f"    ⚠️  File {item.name} already exists in unified folder")
-                    elif item.is_dir():
-                        if not dest.exists():
-                            shutil.copytree(item, dest)
-                            print(f"    📁 Copied directory {item.name}")
-                        else:
-                            # Merge directory contents
-                            for subitem in item.iterdir():
-                                subdest = dest / subitem.name
-                                if not subdest.exists():
-                                    if subitem.is_file():
-                                        shutil.copy2(subitem, subdest)
-                                    else:
-                                        shutil.copytree(subitem, subdest)
+        if serial or len(students) < 2:
+            for username, student_folder in students:
+                migrate_student_folder(student_folder, os.path.join(students_dir, username))
+                students_migrated += 1
+                print(f"    ✅ Migrated {username}")
+            continue
+        
+        # Usernames are unique within a course, so its students copy in parallel;
+        # courses still run in order so the first course's files win, as before
+        with ThreadPoolExecutor(max_workers=min(FOLDER_WORKERS, len(students))) as executor:
+            futures = [executor.submit(migrate_student_buffered, student_folder, os.path.join(students_dir, username))
+                       for username, student_folder in students]
+            
+            for (username, _), future in zip(students, futures):
+                lines, error = future.result()
+                for line in lines:
+                    print(line)
+                if error is not None:
+                    raise error
                 
                 students_migrated += 1
                 print(f"    ✅ Migrated {username}")
     
-    print(f"\n📊 Migration Summary:")
-    print(f"   👥 Students migrated: {students_migrated}")
-    print(f"   📂 New unified location: {students_path}")
-    print(f"   📝 Old course folders preserved for backup")
+    print(f"\n📊 Migration Summary:\n"
+          f"   👥 Students migrated: {students_migrated}\n"
+          f"   📂 New unified location: {students_path}\n"
+          f"   📝 Old course folders preserved for backup")
     
     return True
 
@@ -896,19 +1411,20 @@ def main():
     parser.add_argument('--dry-run', '-d', action='store_true', help='Show what would be created without actually creating files')
     parser.add_argument('--migrate', '-m', action='store_true', help='Migrate existing course-specific folders to unified structure')
     parser.add_argument('--json-only', '-j', action='store_true', help='Generate JSON files for GitHub Actions instead of creating folders')
+    parser.add_argument('--serial', action='store_true', help='With --migrate, copy one student at a time instead of in parallel')
     
     args = parser.parse_args()
     
     base_path = Path(args.base_path)
     
-    print("🎓 Regis University Data Science Practicum - CSV Processor")
-    print("=" * 60)
-    print(f"📁 Base path: {base_path.absolute()}")
+    print(f"🎓 Regis University Data Science Practicum - CSV Processor\n"
+          f"{BANNER}\n"
+          f"📁 Base path: {base_path.absolute()}")
     
     if args.migrate:
         print("🔄 Migration Mode - Converting to unified student structure")
-        print("=" * 60)
-        return 0 if migrate_existing_folders(base_path) else 1
+        print(BANNER)
+        return 0 if migrate_existing_folders(base_path, serial=args.serial) else 1
     
     if not args.csv_file:
         print("❌ CSV file path is required unless using --migrate option")
@@ -924,28 +1440,26 @@ def main():
     elif args.dry_run:
         print("🔍 DRY RUN MODE - No files will be created")
     else:
-        print("� Terminal Mode - Creating student folders + JSON files")
+        print("💻 Terminal Mode - Creating student folders + JSON files")
         print("   📂 Creates student folders with example files")
         print("   📄 Creates JSON data files")
         print("   🎯 Ready for HTML generation")
     
-    print("=" * 60)
-    
-    if args.dry_run:
-        print("🔍 This would process the CSV and show planned actions")
-        return
+    print(BANNER)
     
-    success = process_csv_file(args.csv_file, base_path, json_only=args.json_only)
+    success = process_csv_file(args.csv_file, base_path, json_only=args.json_only, dry_run=args.dry_run)
     
     if success:
         print(f"\n🎉 Processing completed successfully!")
-        if args.json_only:
+        if args.dry_run:
+            print(f"🔍 Dry run: no files were written")
+        elif args.json_only:
             print(f"🤖 GitHub Actions: JSON files generated for automated workflows")
             print(f"🚀 Ready for automated portfolio generation")
         else:
-            print(f"� Terminal: Student folders + JSON files created")
+            print(f"💻 Terminal: Student folders + JSON files created")
             print(f"📂 Student folders: data/students/")
-            print(f"� JSON files: data/")
+            print(f"📄 JSON files: data/")
             print(f"🔄 Next step: Run sync script to generate HTML portfolios")
     else:
         print(f"\n❌ Processing failed!")
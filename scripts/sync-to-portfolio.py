@@ -5,15 +5,97 @@ Syncs student data from regis_std to main regis portfolio repository
 Converts markdown profiles to HTML and organizes data by semester
 """
 
+import hashlib
+import io
 import os
+import sys
 import shutil
 import json
 import yaml
 from pathlib import Path
 import glob
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 import re
 
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# orjson is optional; fall back to the standard library decoder when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Worker processes for per-student page generation
+SYNC_WORKERS = os.cpu_count() or 1
+
+# Per-student record of what was last synced, so unchanged students can be skipped
+SYNC_CACHE_PATH = Path('.sync-cache.json')
+
+# Patterns used by the section parsers, compiled once for all students
+_MD_LINK_RE = re.compile(r'\[(.*?)\]\((.*?)\)')
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_LINKEDIN_URL_RE = re.compile(r'https?://[^\s]*linkedin\.com[^\s]*')
+_GITHUB_URL_RE = re.compile(r'https?://[^\s]*github\.com[^\s]*')
+_URL_RE = re.compile(r'https?://[^\s]+')
+
+# Inline markdown converted in the about text and project descriptions
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_CODE_RE = re.compile(r'`(.*?)`')
+_CODE_HTML = r'<code class="bg-gray-100 px-1 py-0.5 rounded text-sm">\1</code>'
+
+# Report/slides file names for a practicum, keyed by is_practicum_1: one search per name
+# instead of a substring test per candidate ("practicum1", "practicum_1", "practicum 1", ...)
+_PROJECT_FILE_RES = {
+    is_practicum_1: (
+        re.compile(rf'practicum[_ ]?{num}|report'),
+        re.compile(rf'practicum[_ ]?{num}|slides|presentation'),
+    )
+    for is_practicum_1, num in ((True, 1), (False, 2))
+}
+
+# Section header keywords in priority order (more specific names first): (keyword, section)
+_SECTION_KEYWORDS = (
+    ('about', 'about'),
+    ('skill', 'skills'),
+    ('practicum ii', 'practicum2'),
+    ('msds 696', 'practicum2'),
+    ('practicum i', 'practicum1'),
+    ('msds 692', 'practicum1'),
+    ('contact', 'contact'),
+    ('experience', 'experience'),
+    ('achievement', 'achievements'),
+    ('award', 'achievements'),
+)
+
+# Project fields, keyed by the bold label in **Label:** lines
+_PROJECT_FIELDS = {
+    'Title': 'title',
+    'Tags': 'tags',
+    'Abstract': 'abstract',
+    'Technologies Used': 'technologies',
+    'Technologies': 'technologies',
+    'Key Achievements': 'achievements',
+    'Links': 'links',
+}
+
+# Project link kinds in priority order: (keyword in the link line, project field)
+_LINK_KINDS = (
+    ('github', 'github'),
+    ('report', 'report'),
+    ('slide', 'slides'),
+    ('presentation', 'slides'),
+    ('demo', 'demo'),
+)
+
 def parse_markdown_profile(md_path):
     """Parse markdown profile and extract metadata and content"""
     with open(md_path, 'r', encoding='utf-8') as f:
@@ -26,7 +108,7 @@ def parse_markdown_profile(md_path):
             yaml_content = parts[1]
             md_content = parts[2].strip()
             try:
-                metadata = yaml.safe_load(yaml_content)
+                metadata = yaml.load(yaml_content, Loader=YamlLoader)
             except yaml.YAMLError as e:
                 print(f"    ⚠️  YAML parse error: {e}")
                 metadata = {}
@@ -45,6 +127,31 @@ def clean_email(email):
         return email
     return email.replace('@worldclass.regis.edu', '@regis.edu')
 
+# Raw GitHub content URL of this repository's data/ folder
+RAW_DATA_URL = "https://raw.githubusercontent.com/iamgmujtaba/regis_std/main/data"
+
+# Extensions of the extra images picked up from a student's folder
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+# Avatar extensions in priority order
+AVATAR_EXTENSIONS = ('webp', 'jpg', 'jpeg', 'png')
+
+def read_json(path):
+    """Parse a UTF-8 JSON file, with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def list_names(directory):
+    """Names in a directory in os.scandir order, or [] when it is missing or not a directory"""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries]
+    except OSError:
+        return []
+
 def find_student_files(student_dir, course_code, username):
     """Find all student files and generate proper URLs"""
     files = {
@@ -56,66 +163,68 @@ def find_student_files(student_dir, course_code, username):
         'presentations': []
     }
     
-    # Base URL for raw GitHub content
-    base_url = f"https://raw.githubusercontent.com/iamgmujtaba/regis_std/main/data/{course_code}/{username}"
+    # URL prefixes for raw GitHub content, built once per student
+    base_url = f"{RAW_DATA_URL}/{course_code}/{username}/"
+    reports_url = base_url + 'reports/'
+    presentations_url = base_url + 'presentations/'
+    
+    # List the student folder once; every lookup below works on these names
+    names = list_names(student_dir)
+    name_set = set(names)
     
     # Find avatar (priority: webp > jpg > png)
-    for ext in ['webp', 'jpg', 'jpeg', 'png']:
-        avatar_path = student_dir / f'avatar.{ext}'
-        if avatar_path.exists():
-            files['avatar_url'] = f"{base_url}/avatar.{ext}"
+    for ext in AVATAR_EXTENSIONS:
+        if f'avatar.{ext}' in name_set:
+            files['avatar_url'] = f"{base_url}avatar.{ext}"
             print(f"    📸 Found avatar: avatar.{ext}")
             break
     
     # Find CV
-    cv_patterns = ['cv.pdf', f'{username}_cv.pdf', 'resume.pdf', f'{username}_resume.pdf']
-    for pattern in cv_patterns:
-        cv_path = student_dir / pattern
-        if cv_path.exists():
-            files['cv_url'] = f"{base_url}/{pattern}"
+    for pattern in ('cv.pdf', f'{username}_cv.pdf', 'resume.pdf', f'{username}_resume.pdf'):
+        if pattern in name_set:
+            files['cv_url'] = base_url + pattern
             print(f"    📄 Found CV: {pattern}")
             break
     
     # Find reports
-    reports_dir = student_dir / 'reports'
-    if reports_dir.exists():
-        for report_file in reports_dir.glob('*.pdf'):
+    for report_name in list_names(os.path.join(student_dir, 'reports')):
+        if report_name.endswith('.pdf'):
             files['reports'].append({
-                'name': report_file.name,
-                'url': f"{base_url}/reports/{report_file.name}",
+                'name': report_name,
+                'url': reports_url + report_name,
                 'type': 'report'
             })
-            print(f"    📊 Found report: {report_file.name}")
+            print(f"    📊 Found report: {report_name}")
     
     # Find presentations
-    presentations_dir = student_dir / 'presentations'
-    if presentations_dir.exists():
-        for pres_file in presentations_dir.glob('*.pdf'):
+    for pres_name in list_names(os.path.join(student_dir, 'presentations')):
+        if pres_name.endswith('.pdf'):
             files['presentations'].append({
-                'name': pres_file.name,
-                'url': f"{base_url}/presentations/{pres_file.name}",
+                'name': pres_name,
+                'url': presentations_url + pres_name,
                 'type': 'presentation'
             })
-            print(f"    � Found presentation: {pres_file.name}")
+            print(f"    📽️ Found presentation: {pres_name}")
     
     # Find other PDFs in root directory
-    for pdf_file in student_dir.glob('*.pdf'):
-        files['pdfs'].append({
-            'name': pdf_file.name,
-            'url': f"{base_url}/{pdf_file.name}",
-            'type': 'pdf'
-        })
-        print(f"    📄 Found PDF: {pdf_file.name}")
-    
-    # Find images
-    for img_file in student_dir.glob('*.{jpg,jpeg,png,webp}'):
-        if not img_file.name.startswith('avatar'):
+    for pdf_name in names:
+        if pdf_name.endswith('.pdf'):
+            files['pdfs'].append({
+                'name': pdf_name,
+                'url': base_url + pdf_name,
+                'type': 'pdf'
+            })
+            print(f"    📄 Found PDF: {pdf_name}")
+    
+    # Find images (pathlib's glob has no {a,b} braces, so match the extensions directly)
+    for img_name in names:
+        if img_name.endswith(IMAGE_EXTENSIONS) and not img_name.startswith('avatar'):
             files['images'].append({
-                'name': img_file.name,
-                'url': f"{base_url}/{img_file.name}",
+                'name': img_name,
+                'url': base_url + img_name,
                 'type': 'image'
             })
-            print(f"    �️  Found image: {img_file.name}")
+            print(f"    🖼️  Found image: {img_name}")
     
     return files
 
@@ -167,6 +276,7 @@ def parse_markdown_sections(content):
     lines = content.split('\n')
     current_section = None
     current_content = []
+    current_stripped = []  # The same lines stripped, for the structured section parsers
     
     for line in lines:
         line_stripped = line.strip()
@@ -174,67 +284,47 @@ def parse_markdown_sections(content):
         if line_stripped.startswith('## '):
             # Save previous section
             if current_section and current_content:
-                section_content = '\n'.join(current_content).strip()
-                
-                if current_section == 'about':
-                    sections['about'] = section_content
-                elif current_section == 'skills':
-                    sections['skills'] = parse_skills_section(section_content)
-                elif current_section in ['practicum1', 'practicum2']:
-                    sections[current_section] = parse_project_section(section_content)
-                elif current_section == 'contact':
-                    sections['contact'] = parse_contact_section(section_content)
-                elif current_section == 'experience':
-                    sections['experience'] = section_content
-                elif current_section == 'achievements':
-                    sections['achievements'] = parse_achievements_section(section_content)
+                store_section(sections, current_section, current_content, current_stripped)
             
             # Start new section
             section_name = line_stripped[3:].strip().lower()
             current_content = []
+            current_stripped = []
             
-            # Map section names (check more specific conditions first)
-            if 'about' in section_name:
-                current_section = 'about'
-            elif 'skill' in section_name:
-                current_section = 'skills'
-            elif 'practicum ii' in section_name or 'msds 696' in section_name:
-                current_section = 'practicum2'
-            elif 'practicum i' in section_name or 'msds 692' in section_name:
-                current_section = 'practicum1'
-            elif 'contact' in section_name:
-                current_section = 'contact'
-            elif 'experience' in section_name:
-                current_section = 'experience'
-            elif 'achievement' in section_name or 'award' in section_name:
-                current_section = 'achievements'
-            else:
-                current_section = None
+            # Map section names (first matching keyword wins)
+            current_section = None
+            for keyword, section in _SECTION_KEYWORDS:
+                if keyword in section_name:
+                    current_section = section
+                    break
         else:
             if current_section and line_stripped:
                 current_content.append(line)
+                current_stripped.append(line_stripped)
     
     # Save last section
     if current_section and current_content:
-        section_content = '\n'.join(current_content).strip()
-        if current_section == 'about':
-            sections['about'] = section_content
-        elif current_section == 'skills':
-            sections['skills'] = parse_skills_section(section_content)
-        elif current_section in ['practicum1', 'practicum2']:
-            sections[current_section] = parse_project_section(section_content)
-        elif current_section == 'contact':
-            sections['contact'] = parse_contact_section(section_content)
+        store_section(sections, current_section, current_content, current_stripped)
     
     return sections
 
-def parse_skills_section(skills_text):
-    """Parse skills section into structured format"""
+def store_section(sections, section, content_lines, stripped_lines):
+    """
+    Store one section: structured sections get their parser run on the already-stripped
+    lines, text sections keep the original lines joined back together
+    """
+    parser = _SECTION_PARSERS[section]
+    if parser:
+        sections[section] = parser(stripped_lines)
+    else:
+        sections[section] = '\n'.join(content_lines).strip()
+
+def parse_skills_section(lines):
+    """Parse the skills section's stripped lines into structured format"""
     skills = {}
     current_category = None
     
-    for line in skills_text.split('\n'):
-        line = line.strip()
+    for line in lines:
         if line.startswith('**') and line.endswith(':**'):
             current_category = line[2:-3].strip()
             skills[current_category] = []
@@ -244,8 +334,8 @@ def parse_skills_section(skills_text):
     
     return skills
 
-def parse_project_section(project_text):
-    """Parse project section into structured data"""
+def parse_project_section(lines):
+    """Parse the project section's stripped lines into structured data"""
     project = {
         'title': '',
         'tags': [],
@@ -259,56 +349,48 @@ def parse_project_section(project_text):
     }
     
     current_field = None
+    abstract_parts = []  # Abstract text plus continuation lines, joined once at the end
     
-    for line in project_text.split('\n'):
-        line = line.strip()
-        
-        if line.startswith('**Title:**'):
-            project['title'] = line[10:].strip()
-        elif line.startswith('**Tags:**'):
-            tags = line[9:].strip()
-            project['tags'] = [tag.strip() for tag in tags.split(',') if tag.strip()]
-        elif line.startswith('**Abstract:**'):
-            project['abstract'] = line[13:].strip()
-            current_field = 'abstract'
-        elif line.startswith('**Technologies Used:**') or line.startswith('**Technologies:**'):
-            project['technologies'] = line.split(':', 1)[1].strip()
-        elif line.startswith('**Key Achievements:**'):
-            current_field = 'achievements'
-        elif line.startswith('**Links:**'):
-            current_field = 'links'
+    for line in lines:
+        if line.startswith('**'):
+            # Look the **Label:** up once instead of testing every prefix
+            end = line.find(':**', 2)
+            field = _PROJECT_FIELDS.get(line[2:end]) if end != -1 else None
+            value = line[end + 3:].strip()
+            
+            if field == 'title':
+                project['title'] = value
+            elif field == 'tags':
+                project['tags'] = [tag.strip() for tag in value.split(',') if tag.strip()]
+            elif field == 'abstract':
+                abstract_parts = [value] if value else []
+                current_field = 'abstract'
+            elif field == 'technologies':
+                project['technologies'] = line.split(':', 1)[1].strip()
+            elif field is not None:
+                current_field = field
         elif line.startswith('- '):
             if current_field == 'achievements':
                 project['achievements'].append(line[2:].strip())
             elif current_field == 'links':
                 link_text = line[2:].strip()
-                # Parse various link formats
-                if 'github' in link_text.lower():
-                    match = re.search(r'\[(.*?)\]\((.*?)\)', link_text)
-                    if match:
-                        project['github'] = match.group(2)
-                elif 'report' in link_text.lower():
-                    match = re.search(r'\[(.*?)\]\((.*?)\)', link_text)
-                    if match:
-                        project['report'] = match.group(2)
-                elif 'slide' in link_text.lower() or 'presentation' in link_text.lower():
-                    match = re.search(r'\[(.*?)\]\((.*?)\)', link_text)
-                    if match:
-                        project['slides'] = match.group(2)
-                elif 'demo' in link_text.lower():
-                    match = re.search(r'\[(.*?)\]\((.*?)\)', link_text)
-                    if match:
-                        project['demo'] = match.group(2)
-        elif current_field == 'abstract' and line and not line.startswith('**'):
-            if project['abstract']:
-                project['abstract'] += ' ' + line
-            else:
-                project['abstract'] = line
+                link_lower = link_text.lower()
+                # Classify by the first matching keyword, then pull the URL out once
+                for keyword, field in _LINK_KINDS:
+                    if keyword in link_lower:
+                        match = _MD_LINK_RE.search(link_text)
+                        if match:
+                            project[field] = match.group(2)
+                        break
+        elif current_field == 'abstract' and line:
+            abstract_parts.append(line)
+    
+    project['abstract'] = ' '.join(abstract_parts)
     
     return project
 
-def parse_contact_section(contact_text):
-    """Parse contact section with flexible format support"""
+def parse_contact_section(lines):
+    """Parse contact section lines with flexible format support"""
     contact = {
         'email': '',
         'linkedin': '#',
@@ -316,116 +398,150 @@ def parse_contact_section(contact_text):
         'portfolio': '#'
     }
     
-    for line in contact_text.split('\n'):
-        line = line.strip()
+    for line in lines:
+        line_lower = line.lower()
         
         # Handle different markdown formats
-        if 'email' in line.lower() and ('@' in line):
+        if 'email' in line_lower and ('@' in line):
             # Extract email address
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
+            email_match = _EMAIL_RE.search(line)
             if email_match:
                 contact['email'] = clean_email(email_match.group())
         
-        elif 'linkedin' in line.lower():
+        elif 'linkedin' in line_lower:
             # Look for various LinkedIn patterns
             if '[' in line and ']' in line and '(' in line and ')' in line:
                 # Markdown link format [text](url)
-                match = re.search(r'\[.*?\]\((.*?)\)', line)
-                if match and 'linkedin.com' in match.group(1):
-                    contact['linkedin'] = match.group(1)
+                match = _MD_LINK_RE.search(line)
+                if match and 'linkedin.com' in match.group(2):
+                    contact['linkedin'] = match.group(2)
             else:
                 # Look for raw LinkedIn URL
-                linkedin_match = re.search(r'https?://[^\s]*linkedin\.com[^\s]*', line)
+                linkedin_match = _LINKEDIN_URL_RE.search(line)
                 if linkedin_match:
                     contact['linkedin'] = linkedin_match.group()
                 
-        elif 'github' in line.lower():
+        elif 'github' in line_lower:
             # Look for various GitHub patterns  
             if '[' in line and ']' in line and '(' in line and ')' in line:
                 # Markdown link format [text](url)
-                match = re.search(r'\[.*?\]\((.*?)\)', line)
-                if match and 'github.com' in match.group(1):
-                    contact['github'] = match.group(1)
+                match = _MD_LINK_RE.search(line)
+                if match and 'github.com' in match.group(2):
+                    contact['github'] = match.group(2)
             else:
                 # Look for raw GitHub URL
-                github_match = re.search(r'https?://[^\s]*github\.com[^\s]*', line)
+                github_match = _GITHUB_URL_RE.search(line)
                 if github_match:
                     contact['github'] = github_match.group()
         
-        elif ('portfolio' in line.lower() or 'website' in line.lower()) and 'http' in line:
+        elif ('portfolio' in line_lower or 'website' in line_lower) and 'http' in line:
             # Look for portfolio/website URLs
             if '[' in line and ']' in line and '(' in line and ')' in line:
                 # Markdown link format [text](url)  
-                match = re.search(r'\[.*?\]\((.*?)\)', line)
+                match = _MD_LINK_RE.search(line)
                 if match:
-                    contact['portfolio'] = match.group(1)
+                    contact['portfolio'] = match.group(2)
             else:
                 # Look for raw URL
-                url_match = re.search(r'https?://[^\s]+', line)
+                url_match = _URL_RE.search(line)
                 if url_match:
                     contact['portfolio'] = url_match.group()
     
     return contact
 
-def parse_achievements_section(achievements_text):
-    """Parse achievements section into list"""
+def parse_achievements_section(lines):
+    """Parse achievements section lines into list"""
     achievements = []
-    for line in achievements_text.split('\n'):
-        line = line.strip()
+    for line in lines:
         if line.startswith('- '):
             achievements.append(line[2:].strip())
     return achievements
 
+# How each section's text is stored (None keeps the raw text)
+_SECTION_PARSERS = {
+    'about': None,
+    'skills': parse_skills_section,
+    'practicum1': parse_project_section,
+    'practicum2': parse_project_section,
+    'contact': parse_contact_section,
+    'experience': None,
+    'achievements': parse_achievements_section,
+}
+
+@lru_cache(maxsize=None)
+def scan_student_tree(username):
+    """
+    List data/students/<username> and its reports/ and presentations/ once per run
+    Returns a frozenset of paths relative to the student folder ('reports/x.pdf', 'x_cv.pdf', ...)
+    """
+    student_dir = os.path.join('data', 'students', username)
+    existing = set(list_names(student_dir))
+    for subdir in ('reports', 'presentations'):
+        existing.update(f'{subdir}/{name}' for name in list_names(os.path.join(student_dir, subdir)))
+    return frozenset(existing)
+
+@lru_cache(maxsize=None)
+def load_course_students(json_path):
+    """
+    Load a course JSON file once per run and index its students by username
+    Returns None when the file doesn't exist; the first entry wins for a repeated username
+    """
+    if not os.path.exists(json_path):
+        return None
+    
+    course_data = read_json(json_path)
+    
+    students = {}
+    for student in course_data.get('students', []):
+        students.setdefault(student.get('username'), student)
+    return students
+
 def get_project_urls_from_json(username, is_practicum_1):
     """Get project URLs from the JSON data files and check for local files"""
     try:
-        # First check for local PDF files in student directory
-        student_dir = Path('data') / 'students' / username
+        # First check for local PDF files in student directory (listed once per student)
+        existing = scan_student_tree(username)
         project_num = '1' if is_practicum_1 else '2'
         
-        local_report = student_dir / 'reports' / f'{username}_practicum{project_num}_report.pdf'
-        local_slides = student_dir / 'presentations' / f'{username}_practicum{project_num}_slides.pdf'
-        local_cv = student_dir / f'{username}_cv.pdf'
+        report_name = f'{username}_practicum{project_num}_report.pdf'
+        slides_name = f'{username}_practicum{project_num}_slides.pdf'
+        cv_name = f'{username}_cv.pdf'
         
         # Base URL for raw GitHub content
-        base_url = f"https://raw.githubusercontent.com/iamgmujtaba/regis_std/main/data/students/{username}"
+        base_url = f"{RAW_DATA_URL}/students/{username}/"
         
         # Check if local files exist and create URLs
         local_urls = {}
-        if local_report.exists():
-            local_urls['report'] = f"{base_url}/reports/{username}_practicum{project_num}_report.pdf"
-            print(f"    📄 Found local report: {local_report.name}")
+        if f'reports/{report_name}' in existing:
+            local_urls['report'] = f"{base_url}reports/{report_name}"
+            print(f"    📄 Found local report: {report_name}")
         
-        if local_slides.exists():
-            local_urls['slides'] = f"{base_url}/presentations/{username}_practicum{project_num}_slides.pdf"
+        if f'presentations/{slides_name}' in existing:
+            local_urls['slides'] = f"{base_url}presentations/{slides_name}"
             local_urls['presentation'] = local_urls['slides']  # alias
-            print(f"    📄 Found local slides: {local_slides.name}")
+            print(f"    📄 Found local slides: {slides_name}")
         
-        if local_cv.exists():
-            local_urls['cv'] = f"{base_url}/{username}_cv.pdf"
-            print(f"    📄 Found local CV: {local_cv.name}")
+        if cv_name in existing:
+            local_urls['cv'] = base_url + cv_name
+            print(f"    📄 Found local CV: {cv_name}")
         
         # Now try to get URLs from JSON data
         json_filename = "2025_summer_msds692.json" if is_practicum_1 else "2025_summer_msds696.json"
-        json_path = Path('data') / json_filename
+        json_path = os.path.join('data', json_filename)
         
         json_urls = {'github': '#', 'slides': '#', 'report': '#', 'demo': '#'}
         
-        if json_path.exists():
-            with open(json_path, 'r', encoding='utf-8') as f:
-                course_data = json.load(f)
-            
-            # Find the student in the JSON data
-            for student in course_data.get('students', []):
-                if student.get('username') == username:
-                    json_urls.update({
-                        'github': student.get('github', '#'),
-                        'slides': student.get('slides', '#'),
-                        'report': student.get('report', '#'),
-                        'demo': student.get('demo', '#'),
-                        'presentation': student.get('slides', '#')  # alias for slides
-                    })
-                    break
+        # Find the student in the JSON data (parsed once per file for the whole run)
+        course_students = load_course_students(json_path)
+        student = course_students.get(username) if course_students else None
+        if student is not None:
+            json_urls.update({
+                'github': student.get('github', '#'),
+                'slides': student.get('slides', '#'),
+                'report': student.get('report', '#'),
+                'demo': student.get('demo', '#'),
+                'presentation': student.get('slides', '#')  # alias for slides
+            })
         
         # Merge local and JSON URLs (local files take precedence for reports/slides)
         final_urls = {
@@ -461,27 +577,17 @@ def auto_detect_project_files(student_files, course_info, username, project_sect
     }
     
     # Determine if this is Practicum I or II
-    is_practicum_1 = course_info['is_practicum_1']
-    project_num = '1' if is_practicum_1 else '2'
+    report_re, slides_re = _PROJECT_FILE_RES[course_info['is_practicum_1']]
     
     # Try to find report
     for report_file in student_files['reports']:
-        filename = report_file['name'].lower()
-        if (f'practicum{project_num}' in filename or 
-            f'practicum_{project_num}' in filename or
-            f'practicum {project_num}' in filename or
-            'report' in filename):
+        if report_re.search(report_file['name'].lower()):
             project_urls['report'] = report_file['url']
             break
     
     # Try to find presentation
     for pres_file in student_files['presentations']:
-        filename = pres_file['name'].lower()
-        if (f'practicum{project_num}' in filename or 
-            f'practicum_{project_num}' in filename or
-            f'practicum {project_num}' in filename or
-            'slides' in filename or
-            'presentation' in filename):
+        if slides_re.search(pres_file['name'].lower()):
             project_urls['slides'] = pres_file['url']
             break
     
@@ -496,15 +602,35 @@ def auto_detect_project_files(student_files, course_info, username, project_sect
     
     return final_urls
 
-def create_html_page(student_data, course_info, target_dir, markdown_content, metadata, student_files):
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+
+def load_template(name):
+    """Read an HTML template from scripts/templates"""
+    return (TEMPLATES_DIR / name).read_text(encoding='utf-8')
+
+# Student portfolio page, read once at import; the {{ }} pairs are literal braces for the inline JavaScript/Tailwind config
+STUDENT_PAGE_TEMPLATE = load_template('student.html')
+
+# Fragments repeated within a page (one per project, skill category, ...), keyed by component name
+COMPONENT_TEMPLATES = {name: load_template(f'_{name}.html') for name in ('project_card', 'skill_card', 'contact')}
+
+def write_if_changed(path, data):
+    """Write bytes to path unless it already holds exactly them; returns True if the file was written"""
+    try:
+        if os.path.getsize(path) == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    
+    path.write_bytes(data)
+    return True
+
+def create_html_page(student_data, course_info, target_dir, sections, metadata, student_files):
     """Create enhanced HTML page in the student's own directory and optionally in profiles"""
     username = student_data['username']
     name = metadata.get('name', student_data.get('name', 'Student Name'))
     email = clean_email(metadata.get('email', student_data.get('email', 'student@regis.edu')))
     
-    # Parse markdown sections
-    sections = parse_markdown_sections(markdown_content)
-    
     # Student's directory paths
     local_student_dir = Path('data/students') / username
     target_student_dir = target_dir / 'students' / username if target_dir != Path('data') else local_student_dir
@@ -515,25 +641,27 @@ def create_html_page(student_data, course_info, target_dir, markdown_content, me
     # Generate project HTML for ALL practicum experiences
     projects_html = ""
     
+    # Resolve each practicum's URLs once; they feed both the project cards and the CV button
+    practicum1_course_info = {
+        'course': 'MSDS692',
+        'is_practicum_1': True,
+        'semester': 'Summer 2025'
+    }
+    practicum2_course_info = {
+        'course': 'MSDS696',
+        'is_practicum_1': False,
+        'semester': 'Summer 2025'
+    }
+    practicum1_urls = auto_detect_project_files(student_files, practicum1_course_info, username, sections['practicum1']) if sections.get('practicum1') else None
+    practicum2_urls = auto_detect_project_files(student_files, practicum2_course_info, username, sections['practicum2']) if sections.get('practicum2') else None
+    
     # Check for MSDS692 (Practicum I)
-    if sections.get('practicum1') and sections['practicum1'].get('title'):
-        practicum1_course_info = {
-            'course': 'MSDS692',
-            'is_practicum_1': True,
-            'semester': 'Summer 2025'
-        }
-        practicum1_urls = auto_detect_project_files(student_files, practicum1_course_info, username, sections['practicum1'])
+    if practicum1_urls is not None and sections['practicum1'].get('title'):
         practicum1_html = generate_enhanced_project_html(sections['practicum1'], "MSDS 692 - Practicum I", practicum1_course_info, practicum1_urls)
         projects_html += practicum1_html
     
     # Check for MSDS696 (Practicum II)
-    if sections.get('practicum2') and sections['practicum2'].get('title'):
-        practicum2_course_info = {
-            'course': 'MSDS696',
-            'is_practicum_1': False,
-            'semester': 'Summer 2025'
-        }
-        practicum2_urls = auto_detect_project_files(student_files, practicum2_course_info, username, sections['practicum2'])
+    if practicum2_urls is not None and sections['practicum2'].get('title'):
         practicum2_html = generate_enhanced_project_html(sections['practicum2'], "MSDS 696 - Practicum II", practicum2_course_info, practicum2_urls)
         projects_html += practicum2_html
     
@@ -562,408 +690,61 @@ def create_html_page(student_data, course_info, target_dir, markdown_content, me
     avatar_url = student_files['avatar_url'] or f"https://via.placeholder.com/200x200/1e40af/ffffff?text={name[0] if name else 'S'}"
     
     # CV URL - try to get from local files or JSON data
-    cv_url = '#'
-    if sections.get('practicum1'):
-        practicum1_urls = auto_detect_project_files(student_files, {'is_practicum_1': True}, username, sections['practicum1'])
-        cv_url = practicum1_urls.get('cv', cv_url)
-    if cv_url == '#' and sections.get('practicum2'):
-        practicum2_urls = auto_detect_project_files(student_files, {'is_practicum_1': False}, username, sections['practicum2'])
-        cv_url = practicum2_urls.get('cv', cv_url)
+    cv_url = (practicum1_urls or {}).get('cv', '#')
+    if cv_url == '#':
+        cv_url = (practicum2_urls or {}).get('cv', '#')
     if cv_url == '#':
         cv_url = student_files['cv_url'] or '#'
     
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="{name} - Regis University Data Science Student Portfolio">
-    <title>{name} - Regis University Data Science Portfolio</title>
-    
-    <!-- Favicon -->
-    <link rel="icon" type="image/png" href="../assets/img/favicon.png">
-    
-    <!-- Google Fonts -->
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Open+Sans:ital,wght@0,400;0,600;0,700;1,400&family=Georgia:ital,wght@0,400;0,700;1,400&display=swap" rel="stylesheet">
-    
-    <!-- Tailwind CSS -->
-    <script src="https://cdn.tailwindcss.com"></script>
-    
-    <!-- Custom Styles -->
-    <link rel="stylesheet" href="../assets/css/style.css">
-    
-    <!-- Font Awesome -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    
-    <script>
-        tailwind.config = {{
-            theme: {{
-                extend: {{
-                    colors: {{
-                        'regis-blue': '#002B49',
-                        'regis-gold': '#F1C400',
-                        'regis-light-blue': '#CCE2EE',
-                        'regis-gold-accent': '#EDAB00',
-                        'regis-gray': '#D6D2C4',
-                        primary: '#002B49',
-                        secondary: '#F1C400',
-                        accent: '#CCE2EE',
-                    }},
-                    fontFamily: {{
-                        'sans': ['Open Sans', 'system-ui', 'sans-serif'],
-                        'serif': ['Georgia', 'serif'],
-                    }}
-                }}
-            }}
-        }}
-    </script>
-</head>
-<body class="bg-gray-50">
-    <!-- Navigation Bar -->
-    <nav class="bg-white shadow-lg sticky top-0 z-50">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="flex justify-between items-center h-16">
-                <div class="flex items-center">
-                    <img src="../assets/img/anderson_regis_logo.jpeg" alt="Regis University" class="h-8 w-auto mr-3">
-                    <span class="font-bold text-lg text-regis-blue">Portfolio</span>
-                </div>
-                <div class="hidden md:flex space-x-6">
-                    <a href="../index.html" class="text-gray-700 hover:text-regis-blue transition duration-300">
-                        <i class="fas fa-home mr-1"></i> Home
-                    </a>
-                    <a href="#about" class="text-gray-700 hover:text-regis-blue transition duration-300">About</a>
-                    <a href="#projects" class="text-gray-700 hover:text-regis-blue transition duration-300">Projects</a>
-                    <a href="#contact" class="text-gray-700 hover:text-regis-blue transition duration-300">Contact</a>
-                </div>
-                <div class="md:hidden">
-                    <button id="mobile-menu-button" class="text-gray-700 hover:text-regis-blue">
-                        <i class="fas fa-bars text-2xl"></i>
-                    </button>
-                </div>
-            </div>
-        </div>
-        <!-- Mobile Menu -->
-        <div id="mobile-menu" class="hidden md:hidden bg-white border-t">
-            <div class="px-2 pt-2 pb-3 space-y-1">
-                <a href="../index.html" class="block px-3 py-2 text-gray-700 hover:bg-gray-100 rounded">
-                    <i class="fas fa-home mr-1"></i> Home
-                </a>
-                <a href="#about" class="block px-3 py-2 text-gray-700 hover:bg-gray-100 rounded">About</a>
-                <a href="#projects" class="block px-3 py-2 text-gray-700 hover:bg-gray-100 rounded">Projects</a>
-                <a href="#contact" class="block px-3 py-2 text-gray-700 hover:bg-gray-100 rounded">Contact</a>
-            </div>
-        </div>
-    </nav>
-
-    <!-- Hero/Profile Section -->
-    <section class="bg-gradient-to-r from-regis-blue to-regis-gold py-16">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="flex flex-col md:flex-row items-center justify-center gap-8">
-                <!-- Profile Photo -->
-                <div class="flex-shrink-0">
-                    <div class="w-48 h-48 rounded-full overflow-hidden border-4 border-white shadow-2xl bg-white">
-                        <img src="{avatar_url}" 
-                             alt="{name}" 
-                             class="w-full h-full object-cover"
-                             onerror="this.src='https://via.placeholder.com/200x200/1e40af/ffffff?text={name[0] if name else 'S'}'">
-                    </div>
-                </div>
-                
-                <!-- Profile Info -->
-                <div class="text-center md:text-left text-white">
-                    <h1 class="text-4xl md:text-5xl font-bold mb-2">{name}</h1>
-                    <p class="text-xl text-regis-light-blue mb-2">Data Science Graduate Student</p>
-                    <p class="text-lg text-white/80 mb-4">Regis University | {course_info['course']}</p>
-                    
-                    <!-- Social Links -->
-                    <div class="flex justify-center md:justify-start space-x-4 mb-4">
-                        <a href="{sections['contact'].get('github', '#')}" 
-                           target="_blank"
-                           class="w-10 h-10 bg-white text-regis-blue rounded-full flex items-center justify-center hover:bg-regis-light-blue transition duration-300">
-                            <i class="fab fa-github text-xl"></i>
-                        </a>
-                        <a href="{sections['contact'].get('linkedin', '#')}" 
-                           target="_blank"
-                           class="w-10 h-10 bg-white text-regis-blue rounded-full flex items-center justify-center hover:bg-regis-light-blue transition duration-300">
-                            <i class="fab fa-linkedin text-xl"></i>
-                        </a>
-                        <a href="mailto:{email}" 
-                           class="w-10 h-10 bg-white text-regis-blue rounded-full flex items-center justify-center hover:bg-regis-light-blue transition duration-300">
-                            <i class="fas fa-envelope text-xl"></i>
-                        </a>
-                        <a href="{cv_url}" 
-                           class="w-10 h-10 bg-white text-regis-blue rounded-full flex items-center justify-center hover:bg-regis-light-blue transition duration-300 {'opacity-50 cursor-not-allowed' if cv_url == '#' else ''}">
-                            <i class="fas fa-file-pdf text-xl"></i>
-                        </a>
-                    </div>
-                    
-                    <!-- Quick Links -->
-                    <div class="flex flex-wrap justify-center md:justify-start gap-3">
-                        <a href="{cv_url}" 
-                           class="{'bg-white text-regis-blue' if cv_url != '#' else 'bg-gray-300 text-gray-600 cursor-not-allowed'} px-4 py-2 rounded-lg font-semibold hover:bg-regis-light-blue transition duration-300 inline-flex items-center">
-                            <i class="fas fa-download mr-2"></i> Download CV
-                        </a>
-                        <a href="#contact" 
-                           class="bg-transparent border-2 border-white text-white px-4 py-2 rounded-lg font-semibold hover:bg-white hover:text-regis-blue transition duration-300 inline-flex items-center">
-                            <i class="fas fa-paper-plane mr-2"></i> Contact Me
-                        </a>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- About Section -->
-    <section id="about" class="py-16 bg-white">
-        <div class="max-w-5xl mx-auto px-4 sm:px-6 lg:px-8">
-            <h2 class="text-3xl font-bold text-gray-900 mb-4 text-center">About Me</h2>
-            <div class="w-20 h-1 bg-regis-blue mx-auto mb-8"></div>
-            
-            <div class="prose prose-lg max-w-none text-gray-700">
-                {about_html}
-            </div>
-
-            <!-- Skills Section -->
-            <div class="mt-12">
-                <h3 class="text-2xl font-bold text-gray-900 mb-6 text-center">Technical Skills</h3>
-                {skills_html}
-            </div>
-        </div>
-    </section>
-
-    <!-- Projects Section -->
-    <section id="projects" class="py-16 bg-gray-50">
-        <div class="max-w-6xl mx-auto px-4 sm:px-6 lg:px-8">
-            <h2 class="text-3xl font-bold text-gray-900 mb-4 text-center">Data Science Practicum Projects</h2>
-            <div class="w-20 h-1 bg-regis-blue mx-auto mb-12"></div>
-
-            {project_html}
-        </div>
-    </section>
-
-    <!-- Contact Section -->
-    <section id="contact" class="py-16 bg-white">
-        <div class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8">
-            <h2 class="text-3xl font-bold text-gray-900 mb-4 text-center">Get In Touch</h2>
-            <div class="w-20 h-1 bg-regis-blue mx-auto mb-12"></div>
-            {contact_html}
-        </div>
-    </section>
-
-    <!-- Footer -->
-    <footer class="bg-gray-900 text-white py-8">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 text-center">
-            <p class="mb-2">&copy; 2025 {name}. All rights reserved.</p>
-            <p class="text-gray-400 text-sm">Regis University Data Science Practicum Portfolio | Powered by GitHub Pages</p>
-            <div class="mt-4">
-                <a href="../index.html" class="text-gray-400 hover:text-white transition mx-2">
-                    <i class="fas fa-home mr-1"></i> Back to Main Page
-                </a>
-            </div>
-        </div>
-    </footer>
-
-    <!-- Mobile Menu Script -->
-    <script>
-        document.getElementById('mobile-menu-button').addEventListener('click', function() {{
-            const menu = document.getElementById('mobile-menu');
-            menu.classList.toggle('hidden');
-        }});
-
-        // Smooth scrolling for anchor links
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
-            anchor.addEventListener('click', function (e) {{
-                e.preventDefault();
-                const target = document.querySelector(this.getAttribute('href'));
-                if (target) {{
-                    target.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
-                    // Close mobile menu if open
-                    document.getElementById('mobile-menu').classList.add('hidden');
-                }}
-            }});
-        }});
-    </script>
-</body>
-</html>'''
+    html_content = STUDENT_PAGE_TEMPLATE.format_map({
+        'name': name,
+        'initial': name[0] if name else 'S',
+        'email': email,
+        'avatar_url': avatar_url,
+        'course': course_info['course'],
+        'contact_github': sections['contact'].get('github', '#'),
+        'contact_linkedin': sections['contact'].get('linkedin', '#'),
+        'cv_url': cv_url,
+        'cv_icon_class': 'opacity-50 cursor-not-allowed' if cv_url == '#' else '',
+        'cv_button_class': 'bg-white text-regis-blue' if cv_url != '#' else 'bg-gray-300 text-gray-600 cursor-not-allowed',
+        'about_html': about_html,
+        'skills_html': skills_html,
+        'project_html': project_html,
+        'contact_html': contact_html
+    })
+    
+    # Encode once; the same bytes go to both copies
+    html_bytes = html_content.encode('utf-8')
     
     # Write the HTML file in the student's local directory
     local_html_file = local_student_dir / f'{username}.html'
-    with open(local_html_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    print(f"    🌐 Created local HTML: students/{username}/{username}.html")
+    if write_if_changed(local_html_file, html_bytes):
+        print(f"    🌐 Created local HTML: students/{username}/{username}.html")
+    else:
+        print(f"    🌐 Local HTML unchanged: students/{username}/{username}.html")
     
     # Also copy to profiles directory for GitHub Pages (if target is different)
     if profiles_dir:
         profiles_dir.mkdir(exist_ok=True)
         profiles_html_file = profiles_dir / f'{username}.html'
-        with open(profiles_html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print(f"    🌐 Created profile HTML: profiles/{username}.html")
+        if write_if_changed(profiles_html_file, html_bytes):
+            print(f"    🌐 Created profile HTML: profiles/{username}.html")
+        else:
+            print(f"    🌐 Profile HTML unchanged: profiles/{username}.html")
         return f'profiles/{username}.html'
     
     return f'students/{username}/{username}.html'
-    """Generate project HTML with proper PDF links"""
-    if not project_data or not project_data.get('title'):
-        # Default project template
-        return f'''
-        <div class="bg-white rounded-lg shadow-lg overflow-hidden mb-8 border border-gray-200 hover:shadow-xl transition duration-300">
-            <div class="bg-gradient-to-r from-regis-blue to-regis-gold px-6 py-4">
-                <h3 class="text-2xl font-bold text-white flex items-center">
-                    <i class="fas fa-project-diagram mr-3"></i>
-                    {title} Project
-                </h3>
-            </div>
-            <div class="p-6">
-                <h4 class="text-xl font-bold text-gray-900 mb-3">
-                    [Edit your profile.md to add {title.lower()} project details]
-                </h4>
-                
-                <div class="mb-4">
-                    <span class="inline-block bg-regis-light-blue text-regis-blue text-xs font-semibold px-3 py-1 rounded-full mr-2">
-                        <i class="fas fa-tag mr-1"></i> Add Tags
-                    </span>
-                </div>
-
-                <p class="text-gray-700 mb-4 leading-relaxed">
-                    <strong>Abstract:</strong> Please edit your profile.md file to add your project abstract and details.
-                </p>
-
-                <div class="flex flex-wrap gap-3 mt-6">
-                    <a href="#" class="inline-flex items-center px-4 py-2 bg-gray-300 text-gray-600 rounded-lg cursor-not-allowed">
-                        <i class="fab fa-github mr-2"></i> View Code
-                    </a>
-                    <a href="#" class="inline-flex items-center px-4 py-2 bg-gray-300 text-gray-600 rounded-lg cursor-not-allowed">
-                        <i class="fas fa-file-pdf mr-2"></i> Read Report
-                    </a>
-                    <a href="#" class="inline-flex items-center px-4 py-2 bg-gray-300 text-gray-600 rounded-lg cursor-not-allowed">
-                        <i class="fas fa-presentation mr-2"></i> View Slides
-                    </a>
-                </div>
-            </div>
-        </div>'''
-    
-    # Generate tags HTML
-    tags_html = ''
-    for tag in project_data.get('tags', []):
-        color = 'blue' if 'Python' in tag else 'green' if 'Data' in tag else 'purple'
-        tags_html += f'''
-        <span class="inline-block bg-{color}-100 text-{color}-800 text-xs font-semibold px-3 py-1 rounded-full mr-2">
-            <i class="fas fa-tag mr-1"></i> {tag}
-        </span>'''
-    
-    # Generate achievements HTML
-    achievements_html = ''
-    for achievement in project_data.get('achievements', []):
-        achievements_html += f'<li>{achievement}</li>'
-    
-    # Auto-detect PDF files if not specified in markdown
-    report_url = project_data.get('report', '#')
-    slides_url = project_data.get('slides', '#')
-    
-    # Try to find project-specific PDFs
-    project_num = '1' if 'practicum i' in title.lower() else '2'
-    base_url = f"https://raw.githubusercontent.com/iamgmujtaba/regis_std/main/data/{course_code}/{username}"
-    
-    # Look for common report naming patterns
-    if report_url == '#':
-        report_patterns = [
-            f'practicum{project_num}_report.pdf',
-            f'project{project_num}_report.pdf',
-            f'practicum_{project_num}_report.pdf',
-            'report.pdf'
-        ]
-        for pattern in report_patterns:
-            for pdf in student_files['pdfs']:
-                if pattern in pdf['name'].lower():
-                    report_url = pdf['url']
-                    break
-            if report_url != '#':
-                break
-    
-    # Look for common slides naming patterns
-    if slides_url == '#':
-        slides_patterns = [
-            f'practicum{project_num}_slides.pdf',
-            f'practicum{project_num}_presentation.pdf',
-            f'project{project_num}_slides.pdf',
-            'slides.pdf',
-            'presentation.pdf'
-        ]
-        for pattern in slides_patterns:
-            for pdf in student_files['pdfs']:
-                if pattern in pdf['name'].lower():
-                    slides_url = pdf['url']
-                    break
-            if slides_url != '#':
-                break
-    
-    # Generate button classes based on availability
-    github_class = "bg-gray-900 text-white hover:bg-gray-800" if project_data.get('github', '#') != '#' else "bg-gray-300 text-gray-600 cursor-not-allowed"
-    report_class = "bg-regis-blue text-white hover:bg-regis-blue/80" if report_url != '#' else "bg-gray-300 text-gray-600 cursor-not-allowed"
-    slides_class = "bg-regis-gold text-white hover:bg-regis-gold-accent" if slides_url != '#' else "bg-gray-300 text-gray-600 cursor-not-allowed"
-    demo_class = "bg-regis-light-blue text-regis-blue hover:bg-regis-light-blue/80" if project_data.get('demo', '#') != '#' else "bg-gray-300 text-gray-600 cursor-not-allowed"
-    
-    return f'''
-    <div class="bg-white rounded-lg shadow-lg overflow-hidden mb-8 border border-gray-200 hover:shadow-xl transition duration-300">
-        <div class="bg-gradient-to-r from-regis-blue to-regis-gold px-6 py-4">
-            <h3 class="text-2xl font-bold text-white flex items-center">
-                <i class="fas fa-project-diagram mr-3"></i>
-                {title} Project
-            </h3>
-        </div>
-        <div class="p-6">
-            <h4 class="text-xl font-bold text-gray-900 mb-3">
-                {project_data.get('title', f'{title} Project')}
-            </h4>
-            
-            <div class="mb-4">
-                {tags_html}
-            </div>
-
-            <p class="text-gray-700 mb-4 leading-relaxed">
-                <strong>Abstract:</strong> {project_data.get('abstract', 'Please add project abstract in your profile.md file.')}
-            </p>
 
-            {"<div class='border-t border-gray-200 pt-4 mt-4'><h5 class='font-semibold text-gray-900 mb-3'>Key Achievements:</h5><ul class='list-disc list-inside space-y-2 text-gray-700 mb-4'>" + achievements_html + "</ul></div>" if achievements_html else ""}
-
-            <div class="flex flex-wrap gap-3 mt-6">
-                <a href="{project_data.get('github', '#')}" 
-                   {"target='_blank'" if project_data.get('github', '#') != '#' else ""}
-                   class="inline-flex items-center px-4 py-2 {github_class} rounded-lg transition duration-300">
-                    <i class="fab fa-github mr-2"></i> View Code
-                </a>
-                <a href="{report_url}" 
-                   {"target='_blank'" if report_url != '#' else ""}
-                   class="inline-flex items-center px-4 py-2 {report_class} rounded-lg transition duration-300">
-                    <i class="fas fa-file-pdf mr-2"></i> Read Report
-                </a>
-                <a href="{slides_url}" 
-                   {"target='_blank'" if slides_url != '#' else ""}
-                   class="inline-flex items-center px-4 py-2 {slides_class} rounded-lg transition duration-300">
-                    <i class="fas fa-presentation mr-2"></i> View Slides
-                </a>
-                {"<a href='" + project_data.get('demo', '#') + "' target='_blank' class='inline-flex items-center px-4 py-2 " + demo_class + " rounded-lg transition duration-300'><i class='fas fa-external-link-alt mr-2'></i> Live Demo</a>" if project_data.get('demo', '#') != '#' else ""}
-            </div>
-        </div>
-    </div>'''
-
-def format_about_text(about_text):
-    """Format about text as HTML paragraphs"""
-    if not about_text:
-        return '''<p class="text-lg leading-relaxed mb-4">
-            I am a dedicated Data Science student at Regis University, currently completing my practicum 
-            experience. Please edit your profile.md file to add information about yourself.
-        </p>'''
-    
-    paragraphs = about_text.split('\n\n')
-    html = ''
-    for paragraph in paragraphs:
-        if paragraph.strip():
-            html += f'<p class="text-lg leading-relaxed mb-4">{paragraph.strip()}</p>\n'
-    
-    return html
+# Skill categories mapped to (icon, color); other categories get DEFAULT_SKILL_ICON
+SKILL_ICONS = {
+    'Programming Languages': ('fas fa-code', 'blue'),
+    'Tools & Frameworks': ('fas fa-tools', 'green'),
+    'Databases': ('fas fa-database', 'purple'),
+    'Machine Learning': ('fas fa-brain', 'orange'),
+    'Web Development': ('fas fa-laptop-code', 'indigo'),
+    'Data Science': ('fas fa-chart-bar', 'red')
+}
+DEFAULT_SKILL_ICON = ('fas fa-star', 'gray')
 
 def generate_skills_html(skills_dict):
     """Generate skills HTML from parsed skills"""
@@ -991,137 +772,172 @@ def generate_skills_html(skills_dict):
             </div>
         </div>'''
     
-    # Map skill categories to icons and colors
-    skill_icons = {
-        'Programming Languages': ('fas fa-code', 'blue'),
-        'Tools & Frameworks': ('fas fa-tools', 'green'),
-        'Databases': ('fas fa-database', 'purple'),
-        'Machine Learning': ('fas fa-brain', 'orange'),
-        'Web Development': ('fas fa-laptop-code', 'indigo'),
-        'Data Science': ('fas fa-chart-bar', 'red')
-    }
-    
-    html = '<div class="grid grid-cols-2 md:grid-cols-4 gap-4">'
+    # Collect the cards and join once at the end
+    parts = ['<div class="grid grid-cols-2 md:grid-cols-4 gap-4">']
     
     for category, skills_list in skills_dict.items():
-        icon, color = skill_icons.get(category, ('fas fa-star', 'gray'))
+        icon, color = SKILL_ICONS.get(category, DEFAULT_SKILL_ICON)
         skills_text = ', '.join(skills_list[:3])  # Show first 3 skills
         
-        html += f'''
-        <div class="bg-gradient-to-br from-{color}-50 to-{color}-100 p-4 rounded-lg text-center border border-{color}-200">
-            <i class="{icon} text-{color}-600 text-3xl mb-2"></i>
-            <p class="font-semibold">{category}</p>
-            <p class="text-sm text-gray-600">{skills_text}</p>
-        </div>'''
-    
-    html += '</div>'
-    return html
+        parts.append(COMPONENT_TEMPLATES['skill_card'].format_map({
+            'color': color,
+            'icon': icon,
+            'category': category,
+            'skills_text': skills_text,
+        }))
+    
+    parts.append('</div>')
+    return ''.join(parts)
 
 def generate_contact_html(contact_data, email):
     """Generate contact HTML from parsed contact data"""
-    return f'''
-    <div class="grid md:grid-cols-2 gap-8">
-        <!-- Contact Info -->
-        <div>
-            <h3 class="text-xl font-semibold mb-4">Contact Information</h3>
-            <div class="space-y-4">
-                <div class="flex items-start">
-                    <div class="flex-shrink-0">
-                        <div class="w-10 h-10 bg-regis-blue rounded-lg flex items-center justify-center">
-                            <i class="fas fa-envelope text-white"></i>
-                        </div>
-                    </div>
-                    <div class="ml-4">
-                        <p class="font-semibold">Email</p>
-                        <a href="mailto:{email}" class="text-regis-blue hover:underline">
-                            {email}
-                        </a>
-                    </div>
-                </div>
+    linkedin = contact_data.get('linkedin', '#')
+    github = contact_data.get('github', '#')
+    portfolio = contact_data.get('portfolio', '#')
+    return COMPONENT_TEMPLATES['contact'].format_map({
+        'email': email,
+        'linkedin': linkedin,
+        'github': github,
+        'portfolio': portfolio,
+        'linkedin_label': "LinkedIn Profile" if linkedin != '#' else "Add LinkedIn in profile.md",
+        'github_label': "GitHub Profile" if github != '#' else "Add GitHub in profile.md",
+        'portfolio_label': "Personal Website" if portfolio != '#' else "Add portfolio in profile.md",
+    })
 
-                <div class="flex items-start">
-                    <div class="flex-shrink-0">
-                        <div class="w-10 h-10 bg-regis-gold rounded-lg flex items-center justify-center">
-                            <i class="fab fa-linkedin text-white"></i>
-                        </div>
-                    </div>
-                    <div class="ml-4">
-                        <p class="font-semibold">LinkedIn</p>
-                        <a href="{contact_data.get('linkedin', '#')}" 
-                           target="_blank"
-                           class="text-regis-blue hover:underline">
-                            {"LinkedIn Profile" if contact_data.get('linkedin', '#') != '#' else "Add LinkedIn in profile.md"}
-                        </a>
-                    </div>
-                </div>
+@lru_cache(maxsize=None)
+def sync_inputs_digest():
+    """Digest of this script, its page template and the course JSON files; a change to any re-syncs every student"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(STUDENT_PAGE_TEMPLATE.encode())
+    for name in sorted(COMPONENT_TEMPLATES):
+        digest.update(COMPONENT_TEMPLATES[name].encode())
+    for json_filename in ('2025_summer_msds692.json', '2025_summer_msds696.json'):
+        json_path = os.path.join('data', json_filename)
+        digest.update(b'\0' + json_filename.encode())
+        if os.path.exists(json_path):
+            digest.update(Path(json_path).read_bytes())
+    return digest.hexdigest()
 
-                <div class="flex items-start">
-                    <div class="flex-shrink-0">
-                        <div class="w-10 h-10 bg-gray-900 rounded-lg flex items-center justify-center">
-                            <i class="fab fa-github text-white"></i>
-                        </div>
-                    </div>
-                    <div class="ml-4">
-                        <p class="font-semibold">GitHub</p>
-                        <a href="{contact_data.get('github', '#')}" 
-                           target="_blank"
-                           class="text-regis-blue hover:underline">
-                            {"GitHub Profile" if contact_data.get('github', '#') != '#' else "Add GitHub in profile.md"}
-                        </a>
-                    </div>
-                </div>
+def student_sync_key(username, target_dir, profile_path):
+    """Hash everything a student's pages are built from: profile.md, their file names and the shared inputs"""
+    # The generated page itself lives in the student folder; leave it out of the listing
+    names = sorted(scan_student_tree(username) - {f'{username}.html'})
+    
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(sync_inputs_digest().encode())
+    digest.update(b'\0' + str(target_dir).encode() + b'\0')
+    digest.update(profile_path.read_bytes())
+    digest.update(b'\0' + '\n'.join(names).encode())
+    return digest.hexdigest()
 
-                <div class="flex items-start">
-                    <div class="flex-shrink-0">
-                        <div class="w-10 h-10 bg-regis-light-blue rounded-lg flex items-center justify-center">
-                            <i class="fas fa-globe text-regis-blue"></i>
-                        </div>
-                    </div>
-                    <div class="ml-4">
-                        <p class="font-semibold">Portfolio</p>
-                        <a href="{contact_data.get('portfolio', '#')}" 
-                           target="_blank"
-                           class="text-regis-blue hover:underline">
-                            {"Personal Website" if contact_data.get('portfolio', '#') != '#' else "Add portfolio in profile.md"}
-                        </a>
-                    </div>
-                </div>
-            </div>
-        </div>
+def student_pages_exist(username, target_dir):
+    """Check that the pages create_html_page writes for this student are still there"""
+    page_name = f'{username}.html'
+    pages = [os.path.join('data', 'students', username, page_name)]
+    if target_dir != Path('data'):
+        pages.append(os.path.join(os.path.dirname(target_dir), 'profiles', page_name))
+    return all(os.path.exists(page) for page in pages)
 
-        <!-- Quick Message Card -->
-        <div class="bg-gradient-to-br from-regis-light-blue/20 to-regis-gold/20 p-6 rounded-lg border border-regis-light-blue">
-            <h3 class="text-xl font-semibold mb-4">Send a Message</h3>
-            <p class="text-gray-700 mb-4">
-                Feel free to reach out for collaboration opportunities, questions about my projects, 
-                or just to connect!
-            </p>
-            <a href="mailto:{email}?subject=Hello%20from%20your%20portfolio" 
-               class="block w-full bg-regis-blue text-white text-center py-3 rounded-lg font-semibold hover:bg-regis-blue/80 transition duration-300">
-                <i class="fas fa-paper-plane mr-2"></i> Send Email
-            </a>
+def load_sync_cache():
+    """Read the previous run's per-student cache ({} when missing or unreadable)"""
+    try:
+        return read_json(SYNC_CACHE_PATH)
+    except (OSError, ValueError):
+        return {}
+
+def process_student(student_dir, target_dir, cache_entry=None):
+    """
+    Parse one student's profile and write their HTML page(s)
+    Returns (msds692_data, msds696_data, cache_entry), None for a course the student isn't in;
+    when cache_entry from the last run still matches, the student is skipped and its data reused
+    """
+    username = student_dir.name
+    profile_path = student_dir / 'profile.md'
+    
+    print(f"  👤 Processing student: {username}")
+    
+    practicum1_data = practicum2_data = None
+    
+    if profile_path.exists():
+        sync_key = student_sync_key(username, target_dir, profile_path)
+        if cache_entry and cache_entry.get('key') == sync_key and student_pages_exist(username, target_dir):
+            print(f"    ⏭️  Unchanged since last sync, skipping")
+            return cache_entry['msds692'], cache_entry['msds696'], cache_entry
+        
+        metadata, content = parse_markdown_profile(profile_path)
+        
+        # Parse the sections once; they decide the courses and feed every page built below
+        parsed_sections = parse_markdown_sections(content)
+        
+        # Find all student files (images, PDFs) in unified directory
+        student_files = find_student_files(student_dir, 'students', username)
+        
+        # Create base student data entry
+        base_student_data = {
+            'username': username,
+            'name': f"{metadata.get('firstName', '')} {metadata.get('lastName', '')}".strip() or username,
+            'email': metadata.get('email', ''),
+            'semester': metadata.get('semester', 'Spring 2025'),
+            'profilePath': f'regis_std/data/students/{username}/profile.md',
+            'avatarPath': student_files['avatar_url'],  # Direct URL
+            'files': student_files['pdfs'] + student_files['images']
+        }
+        
+        # Check if student has MSDS692 content
+        if parsed_sections.get('practicum1'):
+            practicum1_data = base_student_data.copy()
+            practicum1_data.update({
+                'course': '2025_summer_msds692',
+                'projects': []
+            })
             
-            <div class="mt-6 pt-6 border-t border-regis-light-blue">
-                <p class="text-sm text-gray-600 text-center mb-3">Connect on social media:</p>
-                <div class="flex justify-center space-x-4">
-                    <a href="{contact_data.get('github', '#')}" 
-                       target="_blank"
-                       class="w-10 h-10 bg-gray-900 text-white rounded-full flex items-center justify-center hover:bg-gray-800 transition">
-                        <i class="fab fa-github"></i>
-                    </a>
-                    <a href="{contact_data.get('linkedin', '#')}" 
-                       target="_blank"
-                       class="w-10 h-10 bg-regis-blue text-white rounded-full flex items-center justify-center hover:bg-regis-blue/80 transition">
-                        <i class="fab fa-linkedin"></i>
-                    </a>
-                    <a href="mailto:{email}" 
-                       class="w-10 h-10 bg-red-600 text-white rounded-full flex items-center justify-center hover:bg-red-700 transition">
-                        <i class="fas fa-envelope"></i>
-                    </a>
-                </div>
-            </div>
-        </div>
-    </div>'''
+            # Create HTML page for MSDS692
+            course_info_692 = {
+                'course': 'MSDS692', 
+                'is_practicum_1': True, 
+                'semester': 'Summer 2025'
+            }
+            html_path = create_html_page(practicum1_data, course_info_692, target_dir, parsed_sections, metadata, student_files)
+            practicum1_data['profilePage'] = html_path
+            
+            print(f"    ✅ Added to MSDS692: {base_student_data['name']} ({username})")
+        
+        # Check if student has MSDS696 content  
+        if parsed_sections.get('practicum2'):
+            practicum2_data = base_student_data.copy()
+            practicum2_data.update({
+                'course': '2025_summer_msds696',
+                'projects': []
+            })
+            
+            # Create HTML page for MSDS696
+            course_info_696 = {
+                'course': 'MSDS696', 
+                'is_practicum_1': False, 
+                'semester': 'Summer 2025'
+            }
+            html_path = create_html_page(practicum2_data, course_info_696, target_dir, parsed_sections, metadata, student_files)
+            practicum2_data['profilePage'] = html_path
+            
+            print(f"    ✅ Added to MSDS696: {base_student_data['name']} ({username})")
+            
+        return practicum1_data, practicum2_data, {
+            'key': sync_key,
+            'msds692': practicum1_data,
+            'msds696': practicum2_data
+        }
+    else:
+        print(f"    ⚠️  No profile.md found for {username}")
+    
+    return practicum1_data, practicum2_data, None
+
+def sync_student(student_dir, target_dir, cache_entry=None):
+    """Run process_student with its output captured; returns (log, msds692_data, msds696_data, cache_entry)"""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        practicum1_data, practicum2_data, cache_entry = process_student(student_dir, target_dir, cache_entry)
+    return output.getvalue(), practicum1_data, practicum2_data, cache_entry
 
 def sync_student_data():
     """Sync student data and create HTML profiles from unified student directory"""
@@ -1154,77 +970,34 @@ def sync_student_data():
     msds696_students = []
     
     # Process each student in the unified directory
-    for student_dir in students_dir.glob('*/'):
-        if not student_dir.is_dir():
-            continue
-            
-        username = student_dir.name
-        profile_path = student_dir / 'profile.md'
-        
-        print(f"  👤 Processing student: {username}")
-        
-        if profile_path.exists():
-            metadata, content = parse_markdown_profile(profile_path)
-            
-            # Parse the content to see which courses this student is in
-            parsed_sections = parse_markdown_sections(content)
-            
-            # Find all student files (images, PDFs) in unified directory
-            student_files = find_student_files(student_dir, 'students', username)
-            
-            # Create base student data entry
-            base_student_data = {
-                'username': username,
-                'name': f"{metadata.get('firstName', '')} {metadata.get('lastName', '')}".strip() or username,
-                'email': metadata.get('email', ''),
-                'semester': metadata.get('semester', 'Spring 2025'),
-                'profilePath': f'regis_std/data/students/{username}/profile.md',
-                'avatarPath': student_files['avatar_url'],  # Direct URL
-                'files': student_files['pdfs'] + student_files['images']
-            }
-            
-            # Check if student has MSDS692 content
-            if parsed_sections.get('practicum1'):
-                practicum1_data = base_student_data.copy()
-                practicum1_data.update({
-                    'course': '2025_summer_msds692',
-                    'projects': []
-                })
-                
-                # Create HTML page for MSDS692
-                course_info_692 = {
-                    'course': 'MSDS692', 
-                    'is_practicum_1': True, 
-                    'semester': 'Summer 2025'
-                }
-                html_path = create_html_page(practicum1_data, course_info_692, target_dir, content, metadata, student_files)
-                practicum1_data['profilePage'] = html_path
-                
-                msds692_students.append(practicum1_data)
-                print(f"    ✅ Added to MSDS692: {base_student_data['name']} ({username})")
-            
-            # Check if student has MSDS696 content  
-            if parsed_sections.get('practicum2'):
-                practicum2_data = base_student_data.copy()
-                practicum2_data.update({
-                    'course': '2025_summer_msds696',
-                    'projects': []
-                })
-                
-                # Create HTML page for MSDS696
-                course_info_696 = {
-                    'course': 'MSDS696', 
-                    'is_practicum_1': False, 
-                    'semester': 'Summer 2025'
-                }
-                html_path = create_html_page(practicum2_data, course_info_696, target_dir, content, metadata, student_files)
-                practicum2_data['profilePage'] = html_path
-                
-                msds696_students.append(practicum2_data)
-                print(f"    ✅ Added to MSDS696: {base_student_data['name']} ({username})")
-                
-        else:
-            print(f"    ⚠️  No profile.md found for {username}")
+    student_dirs = [student_dir for student_dir in students_dir.glob('*/') if student_dir.is_dir()]
+    cache = load_sync_cache()
+    cache_entries = [cache.get(student_dir.name) for student_dir in student_dirs]
+    
+    if SYNC_WORKERS < 2 or len(student_dirs) < 2:
+        results = [process_student(student_dir, target_dir, cache_entry)
+                   for student_dir, cache_entry in zip(student_dirs, cache_entries)]
+    else:
+        # Students are independent (each writes only its own pages), so they run in
+        # separate processes; logs are printed afterwards in the original order
+        results = []
+        with ProcessPoolExecutor(max_workers=min(SYNC_WORKERS, len(student_dirs))) as executor:
+            for log, *result in executor.map(sync_student, student_dirs, repeat(target_dir), cache_entries):
+                sys.stdout.write(log)
+                results.append(result)
+    
+    new_cache = {}
+    for student_dir, (practicum1_data, practicum2_data, cache_entry) in zip(student_dirs, results):
+        if practicum1_data:
+            msds692_students.append(practicum1_data)
+        if practicum2_data:
+            msds696_students.append(practicum2_data)
+        if cache_entry:
+            new_cache[student_dir.name] = cache_entry
+    
+    # Remember this run so unchanged students are skipped next time
+    cache_bytes = orjson.dumps(new_cache) if orjson is not None else json.dumps(new_cache).encode('utf-8')
+    write_if_changed(SYNC_CACHE_PATH, cache_bytes)
     
     # Create separate JSON files for each course (preserve CSV data, enhance with portfolio paths)
     courses_data = [
@@ -1244,8 +1017,7 @@ def sync_student_data():
             existing_data = None
             if local_json_path.exists():
                 try:
-                    with open(local_json_path, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
+                    existing_data = read_json(local_json_path)
                     print(f"📄 Found existing CSV-generated JSON for {course_display}")
                 except Exception as e:
                     print(f"⚠️  Could not read existing JSON: {e}")
@@ -1290,7 +1062,7 @@ def sync_student_data():
             
             # Don't write back to JSON files - sync script should only generate HTML
             print(f"📊 Using {course_display} data file with {len(semester_data['students'])} students for HTML generation")
-            print(f"� Reading from: {local_json_path} (read-only)")
+            print(f"📖 Reading from: {local_json_path} (read-only)")
         else:
             print(f"⏭️  No students found for {course_display}, skipping JSON creation")
     
@@ -1338,7 +1110,7 @@ def generate_enhanced_project_html(project_content, project_title, course_info,
                 content_title = line.strip('#').strip() or project_title
                 description_start = i + 1
                 break
-            elif line.strip() and not line.startswith('-') and not line.startswith('*'):
+            elif line.strip() and not line.startswith(('-', '*')):
                 content_title = line.strip() or project_title
                 description_start = i + 1
                 break
@@ -1354,9 +1126,9 @@ def generate_enhanced_project_html(project_content, project_title, course_info,
     description_html = description
     if description:
         # Simple markdown conversion
-        description_html = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', description)
-        description_html = re.sub(r'\*(.*?)\*', r'<em>\1</em>', description)
-        description_html = re.sub(r'`(.*?)`', r'<code class="bg-gray-100 px-1 py-0.5 rounded text-sm">\1</code>', description_html)
+        description_html = _BOLD_RE.sub(r'<strong>\1</strong>', description)
+        description_html = _ITALIC_RE.sub(r'<em>\1</em>', description)
+        description_html = _CODE_RE.sub(_CODE_HTML, description_html)
         description_html = description_html.replace('\n\n', '</p><p class="mb-4">').replace('\n', '<br>')
         description_html = f'<p class="mb-4">{description_html}</p>'
     else:
@@ -1365,41 +1137,40 @@ def generate_enhanced_project_html(project_content, project_title, course_info,
     # Generate achievements HTML
     achievements_html = ''
     if achievements:
-        achievements_html = '<div class="mb-6"><h4 class="font-semibold mb-3">Key Achievements:</h4><ul class="list-disc list-inside space-y-1">'
-        for achievement in achievements[:5]:  # Limit to 5 achievements
-            achievements_html += f'<li class="text-gray-700">{achievement}</li>'
-        achievements_html += '</ul></div>'
+        items = ''.join(f'<li class="text-gray-700">{achievement}</li>' for achievement in achievements[:5])  # Limit to 5 achievements
+        achievements_html = f'<div class="mb-6"><h4 class="font-semibold mb-3">Key Achievements:</h4><ul class="list-disc list-inside space-y-1">{items}</ul></div>'
     
     # Generate project links
     links_html = ''
     if any(project_urls.values()):
-        links_html = '<div class="flex flex-wrap gap-3 mt-6">'
+        links = ['<div class="flex flex-wrap gap-3 mt-6">']
         
         if project_urls.get('github'):
-            links_html += f'''
+            links.append(f'''
             <a href="{project_urls['github']}" target="_blank" 
                class="inline-flex items-center px-4 py-2 bg-gray-800 text-white rounded-lg hover:bg-gray-700 transition duration-300">
                 <i class="fab fa-github mr-2"></i> GitHub Repository
             </a>
-            '''
+            ''')
         
         if project_urls.get('presentation'):
-            links_html += f'''
+            links.append(f'''
             <a href="{project_urls['presentation']}" 
                class="inline-flex items-center px-4 py-2 bg-regis-blue text-white rounded-lg hover:bg-regis-blue/80 transition duration-300">
                 <i class="fas fa-presentation-screen mr-2"></i> Presentation
             </a>
-            '''
+            ''')
         
         if project_urls.get('report'):
-            links_html += f'''
+            links.append(f'''
             <a href="{project_urls['report']}" 
                class="inline-flex items-center px-4 py-2 bg-red-600 text-white rounded-lg hover:bg-red-700 transition duration-300">
                 <i class="fas fa-file-pdf mr-2"></i> Project Report
             </a>
-            '''
+            ''')
         
-        links_html += '</div>'
+        links.append('</div>')
+        links_html = ''.join(links)
     
     # Generate course badge
     course_badge = ''
@@ -1408,24 +1179,14 @@ def generate_enhanced_project_html(project_content, project_title, course_info,
     else:
         course_badge = '<span class="inline-block bg-regis-gold/30 text-regis-blue text-xs font-semibold px-2.5 py-0.5 rounded-full">MSDS 696</span>'
     
-    return f'''
-    <div class="bg-white rounded-lg shadow-lg p-8 hover:shadow-xl transition duration-300">
-        <div class="mb-4">
-            {course_badge}
-        </div>
-        <h3 class="text-2xl font-bold text-gray-900 mb-4">{content_title}</h3>
-        <div class="text-gray-700 leading-relaxed mb-4">
-            {description_html}
-        </div>
-        {links_html}
-        <div class="mt-6 pt-4 border-t border-gray-200">
-            <small class="text-gray-500">
-                <i class="fas fa-university mr-1"></i>
-                Regis University | {course_info['course']} | {course_info['semester']}
-            </small>
-        </div>
-    </div>
-    '''
+    return COMPONENT_TEMPLATES['project_card'].format_map({
+        'course_badge': course_badge,
+        'content_title': content_title,
+        'description_html': description_html,
+        'links_html': links_html,
+        'course': course_info['course'],
+        'semester': course_info['semester'],
+    })
 
 def generate_project_html(project_data, title, gradient_color, student_files, course_code, username):
     """Generate project HTML with course context (legacy function for compatibility)"""
@@ -1459,9 +1220,9 @@ def format_about_text(about_content):
     html_content = about_content
     
     # Convert markdown formatting
-    html_content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html_content)
-    html_content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', html_content)
-    html_content = re.sub(r'`(.*?)`', r'<code class="bg-gray-100 px-1 py-0.5 rounded text-sm">\1</code>', html_content)
+    html_content = _BOLD_RE.sub(r'<strong>\1</strong>', html_content)
+    html_content = _ITALIC_RE.sub(r'<em>\1</em>', html_content)
+    html_content = _CODE_RE.sub(_CODE_HTML, html_content)
     
     # Handle paragraphs
     paragraphs = html_content.split('\n\n')